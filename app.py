@@ -1,6 +1,6 @@
 import streamlit as st
+import csv
 import os
-import pandas as pd
 import random
 import time
 import uuid
@@ -16,38 +16,54 @@ st.set_page_config(page_title="Bollywood Guess", page_icon="🎥")
 st.title(APP_TITLE)
 
 # --- LOAD DATA ---
+# Cell values pandas.read_csv treats as NaN by default
+NA_VALUES = {'', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan',
+             '1.#IND', '1.#QNAN', '<NA>', 'N/A', 'NA', 'NULL', 'NaN', 'None', 'n/a',
+             'nan', 'null'}
+
 @st.cache_data
 def load_data():
-    """Loads the CSV and ensures we only use rows where images exist."""
+    """Loads the CSV into a list of row dicts (missing cells as None)."""
     if not os.path.exists(CSV_FILE):
         st.error(f"❌ Missing file: {CSV_FILE}. Please upload your spreadsheet!")
-        return pd.DataFrame()
-    
-    df = pd.read_csv(CSV_FILE)
-    df.columns = [c.strip().lower() for c in df.columns]
-    return df
-
-def get_valid_game_data(df):
-    """Filters the dataframe to include only images that actually exist in the folder."""
-    if df.empty:
         return []
+
+    with open(CSV_FILE, newline='', encoding='utf-8-sig') as f:
+        reader = csv.reader(f)
+        header = next(reader, None) or []
+        columns = [c.strip().lower() for c in header]
+        rows = []
+        for values in reader:
+            if not values:
+                continue
+            values += [''] * (len(columns) - len(values))
+            rows.append({col: (None if val in NA_VALUES else val) for col, val in zip(columns, values)})
+    return rows
+
+def get_valid_game_data(rows):
+    """Filters the rows to include only images that actually exist in the folder."""
     valid_rounds = []
-    for index, row in df.iterrows():
+    for row in rows:
+        if not row.get('filename'):
+            continue
         image_path = os.path.join(IMAGE_FOLDER, row['filename'])
         if os.path.exists(image_path):
-            valid_rounds.append(row.to_dict())
+            valid_rounds.append(row)
     return valid_rounds
 
+def new_deck():
+    """Shuffles the valid rows once so next_movie() can pop in O(1)."""
+    deck = get_valid_game_data(load_data())
+    random.shuffle(deck)
+    st.session_state.deck = deck
+
 def next_movie():
-    """Picks a random row from the valid data, excluding previously shown ones."""
-    df = load_data()
-    valid_data = get_valid_game_data(df)
-    
-    shown_list = st.session_state.get('shown_movies', [])
-    available_movies = [m for m in valid_data if m['filename'] not in shown_list]
-    
-    if available_movies:
-        choice = random.choice(available_movies)
+    """Pops the next row from the shuffled deck (no repeats until Start Over)."""
+    if 'deck' not in st.session_state:
+        new_deck()
+
+    if st.session_state.deck:
+        choice = st.session_state.deck.pop()
         st.session_state.current_round = choice
         st.session_state.shown_movies.append(choice['filename'])
         
@@ -228,6 +244,7 @@ if st.session_state.get('game_over', False):
     if st.button("🔄 Start Over"):
         st.session_state.shown_movies = []
         st.session_state.game_over = False
+        new_deck()
         next_movie()
         st.rerun()
 
@@ -254,10 +271,7 @@ elif 'current_round' in st.session_state and st.session_state.current_round:
             st.session_state.show_answer = True
             
     with col3:
-        df = load_data()
-        total_valid = len(get_valid_game_data(df))
-        shown_count = len(st.session_state.shown_movies)
-        remaining = total_valid - shown_count
+        remaining = len(st.session_state.deck)
         
         if st.button(f"⏭️ Next ({remaining} left)"):
             next_movie()
@@ -267,8 +281,8 @@ elif 'current_round' in st.session_state and st.session_state.current_round:
     st.markdown("---")
     
     if st.session_state.show_hint:
-        custom_hint = current.get('hint', '')
-        if pd.isna(custom_hint) or custom_hint == '':
+        custom_hint = current.get('hint')
+        if not custom_hint:
              movie_name = current['movie_name']
              hint_text = f"Starts with **{movie_name[0]}**... ({len(movie_name)} chars)"
         else:
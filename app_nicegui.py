@@ -16,12 +16,33 @@ THEMES:
 - Hollywood: Silver, Red, Royal Blue, Deep Navy (Academy Awards inspired)
 """
 
+import asyncio
+import base64
+import csv
+import gzip
+import hashlib
+import heapq
+import io
+import itertools
+import json
+import logging
+import math
+import mimetypes
 import os
+import re
+import secrets
+import sqlite3
+import struct
 import sys
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-import pandas as pd
 import random
-from nicegui import ui, app
+from fastapi import Request, Response
+from fastapi.responses import FileResponse
+from nicegui import ui, app, background_tasks, run
 
 # =============================================================================
 # CONFIGURATION
@@ -29,6 +50,30 @@ from nicegui import ui, app
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 DEFAULT_DURATION_SEC = 60
 
+# Hot reload of theme content (set CATALOG_WATCH=0 to disable)
+CATALOG_WATCH = os.environ.get('CATALOG_WATCH', '1') != '0'
+CATALOG_POLL_SEC = float(os.environ.get('CATALOG_POLL_SEC', 2.0))  # Polling fallback interval
+
+# Catalog backend: 'memory' (shared in-process catalogs) or 'sqlite' (indexed store on disk)
+CATALOG_BACKEND = os.environ.get('CATALOG_BACKEND', 'memory')
+CATALOG_DB = os.environ.get('CATALOG_DB', os.path.join(SCRIPT_DIR, 'catalog.sqlite3'))
+
+# Responsive image variants (needs Pillow; without it the original frames are served)
+IMAGE_VARIANT_WIDTHS = (320, 480, 720, 1080)  # Width buckets offered in srcset
+IMAGE_CACHE_DIR = os.environ.get('IMAGE_CACHE_DIR', os.path.join(SCRIPT_DIR, '.image-cache'))
+IMAGE_CACHE_MAX_MB = float(os.environ.get('IMAGE_CACHE_MAX_MB', 200))
+IMAGE_WORKERS = int(os.environ.get('IMAGE_WORKERS', 2))
+# In-memory byte cache in front of /frames (0 disables); optionally preloaded with the default theme
+FRAME_CACHE_MB = float(os.environ.get('FRAME_CACHE_MB', 64))
+FRAME_CACHE_WARM = os.environ.get('FRAME_CACHE_WARM', '').lower() in ('1', 'true', 'yes')
+# Progressive reveal tiers, most blurred first: (width, Gaussian blur radius at that width).
+# Upscaled to the card, each one looks about as blurred as the CSS blur it replaces.
+REVEAL_TIERS = ((48, 1.0), (80, 1.0), (140, 0.8), (280, 0.6))
+
+# Background tabs: after this many seconds hidden, a game is serialized and the client detached (0 = never)
+IDLE_TIMEOUT_SEC = float(os.environ.get('IDLE_TIMEOUT_SEC', 1800))
+SUSPENDED_GAMES_MAX = int(os.environ.get('SUSPENDED_GAMES_MAX', 500))  # Oldest suspended games are dropped first
+
 # =============================================================================
 # THEME CONFIGURATION - Bollywood & Hollywood
 # =============================================================================
@@ -214,6 +259,7 @@ def get_timer_duration():
     return DEFAULT_DURATION_SEC
 
 GAME_DURATION_SEC = get_timer_duration()
+MAX_BLUR_PX = 10  # Blur at the start of a round (recognizable but challenging)
 
 # Default theme for initial load
 DEFAULT_THEME = 'bollywood'
@@ -222,1003 +268,2487 @@ DEFAULT_THEME = 'bollywood'
 # STYLES - Dynamic Theme-Aware CSS Generation
 # =============================================================================
 
-def generate_theme_css(theme_colors):
-    """Generate CSS with theme-specific colors."""
-    c = theme_colors
-    return f'''
+FONTS_HEAD_HTML = '''
     <!-- Google Fonts: Rozha One for dramatic headlines, Poppins for modern body -->
     <link href="https://fonts.googleapis.com/css2?family=Rozha+One&family=Poppins:wght@400;600;700;800&display=swap" rel="stylesheet">
+'''
 
-    <style>
-        /* ===== BASE STYLES ===== */
-        * {{
-            font-family: 'Poppins', sans-serif;
-        }}
 
-        /* ===== HEADLINE FONT ===== */
-        .bollywood-title {{
-            font-family: 'Rozha One', serif !important;
-            letter-spacing: 2px;
+def generate_theme_rules(theme_colors):
+    """Generate the game's CSS rules for a color palette (see generate_theme_css)."""
+    c = theme_colors
+    return f'''
+    /* ===== BASE STYLES ===== */
+    * {{
+        font-family: 'Poppins', sans-serif;
+    }}
+
+    /* ===== HEADLINE FONT ===== */
+    .bollywood-title {{
+        font-family: 'Rozha One', serif !important;
+        letter-spacing: 2px;
+    }}
+
+    /* ===== ANIMATIONS ===== */
+
+    /* Primary shimmer effect */
+    @keyframes primaryShimmer {{
+        0% {{ background-position: -200% center; }}
+        100% {{ background-position: 200% center; }}
+    }}
+
+    /* Spotlight pulse */
+    @keyframes spotlightPulse {{
+        0%, 100% {{ opacity: 0.8; transform: scale(1); }}
+        50% {{ opacity: 1; transform: scale(1.02); }}
+    }}
+
+    /* Star twinkle */
+    @keyframes twinkle {{
+        0%, 100% {{ opacity: 1; transform: scale(1); }}
+        50% {{ opacity: 0.5; transform: scale(0.8); }}
+    }}
+
+    /* Float up */
+    @keyframes floatUp {{
+        0% {{ transform: translateY(100px); opacity: 0; }}
+        100% {{ transform: translateY(0); opacity: 1; }}
+    }}
+
+    /* Glow pulse */
+    @keyframes glowPulse {{
+        0%, 100% {{ box-shadow: 0 0 20px {c['primary']}80; }}
+        50% {{ box-shadow: 0 0 40px {c['primary']}cc, 0 0 60px {c['accent']}66; }}
+    }}
+
+    /* Film reel rotation */
+    @keyframes reelSpin {{
+        0% {{ transform: rotate(0deg); }}
+        100% {{ transform: rotate(360deg); }}
+    }}
+
+    /* Countdown pulse */
+    @keyframes countdownPulse {{
+        0%, 100% {{ transform: translate(-50%, -50%) scale(1); }}
+        50% {{ transform: translate(-50%, -50%) scale(1.1); }}
+    }}
+
+    /* Progressive reveal: 10px blur clearing linearly; duration/offset set per round */
+    @keyframes progressiveBlur {{
+        from {{ filter: blur(10px); }}
+        to {{ filter: blur(0px); }}
+    }}
+
+    /* Confetti fall */
+    @keyframes confettiFall {{
+        0% {{ transform: translateY(-100vh) rotate(0deg); opacity: 1; }}
+        100% {{ transform: translateY(100vh) rotate(720deg); opacity: 0; }}
+    }}
+
+    /* ===== COMPONENT STYLES ===== */
+
+    /* Main title with primary gradient */
+    .main-title {{
+        font-family: 'Rozha One', serif !important;
+        font-size: 3.5rem;
+        background: linear-gradient(
+            90deg,
+            {c['primary']} 0%,
+            {c['primary_light']} 25%,
+            {c['primary']} 50%,
+            {c['primary_light']} 75%,
+            {c['primary']} 100%
+        );
+        background-size: 200% auto;
+        -webkit-background-clip: text;
+        -webkit-text-fill-color: transparent;
+        background-clip: text;
+        animation: primaryShimmer 3s linear infinite;
+        text-shadow: none;
+        filter: drop-shadow(0 2px 4px rgba(0,0,0,0.3));
+    }}
+
+    /* Subtitle styling */
+    .subtitle {{
+        font-family: 'Poppins', sans-serif;
+        color: {c['text_light']};
+        font-size: 1.1rem;
+        letter-spacing: 4px;
+        text-transform: uppercase;
+        opacity: 0.9;
+    }}
+
+    /* Game card with spotlight effect */
+    .game-card {{
+        background: linear-gradient(145deg, rgba(255,248,231,0.98), rgba(255,248,231,0.92));
+        border-radius: 24px;
+        box-shadow:
+            0 25px 50px rgba(0,0,0,0.4),
+            0 0 100px {c['primary']}33,
+            inset 0 1px 0 rgba(255,255,255,0.8);
+        animation: spotlightPulse 4s ease-in-out infinite;
+        border: 2px solid {c['primary']}4d;
+    }}
+
+    /* Film strip decoration */
+    .film-strip-border {{
+        background: repeating-linear-gradient(
+            90deg,
+            {c['bg_mid']} 0px,
+            {c['bg_mid']} 10px,
+            {c['primary']} 10px,
+            {c['primary']} 12px,
+            {c['bg_mid']} 12px,
+            {c['bg_mid']} 22px
+        );
+        height: 12px;
+        border-radius: 12px 12px 0 0;
+    }}
+
+    /* Theme button base */
+    .bollywood-btn {{
+        font-family: 'Poppins', sans-serif;
+        font-weight: 600;
+        font-size: 0.75rem;
+        padding: 8px 18px;
+        border-radius: 25px;
+        border: 1.5px solid {c['primary']};
+        text-transform: uppercase;
+        letter-spacing: 1px;
+        cursor: pointer;
+        transition: all 0.3s cubic-bezier(0.4, 0, 0.2, 1);
+        box-shadow:
+            0 2px 8px rgba(0,0,0,0.2),
+            inset 0 1px 0 rgba(255,255,255,0.3);
+        touch-action: manipulation;
+        -webkit-tap-highlight-color: transparent;
+        -webkit-touch-callout: none;
+        user-select: none;
+    }}
+
+    .bollywood-btn:hover {{
+        transform: translateY(-2px) scale(1.02);
+        box-shadow:
+            0 8px 25px rgba(0,0,0,0.4),
+            0 0 20px {c['primary']}66;
+    }}
+
+    .bollywood-btn:active {{
+        transform: translateY(0) scale(0.98);
+    }}
+
+    @media (pointer: coarse) {{
+        .bollywood-btn:active {{
+            transform: scale(0.95);
         }}
-
-        /* ===== ANIMATIONS ===== */
-
-        /* Primary shimmer effect */
-        @keyframes primaryShimmer {{
-            0% {{ background-position: -200% center; }}
-            100% {{ background-position: 200% center; }}
+    }}
+
+    /* Button variants */
+    .btn-gold {{
+        background: linear-gradient(145deg, {c['primary_light']}, {c['primary']}, {c['primary_dark']});
+        color: {c['text_dark']};
+    }}
+
+    .btn-magenta {{
+        background: linear-gradient(145deg, {c['accent']}, {c['accent']}dd, {c['accent_dark']});
+        color: white;
+    }}
+
+    .btn-turquoise {{
+        background: linear-gradient(145deg, {c['secondary']}, {c['secondary']}dd, {c['secondary']}aa);
+        color: white;
+    }}
+
+    /* Movie frame */
+    .movie-frame {{
+        position: relative;
+        border-radius: 16px;
+        overflow: hidden;
+        box-shadow:
+            0 10px 40px rgba(0,0,0,0.4),
+            0 0 0 4px {c['primary']},
+            0 0 0 8px {c['bg_mid']},
+            0 0 60px {c['primary']}33;
+    }}
+
+    /* Timer styling */
+    .timer-container {{
+        background: linear-gradient(145deg, {c['primary']}, {c['primary_dark']});
+        border-radius: 50%;
+        padding: 4px;
+        box-shadow:
+            0 4px 20px {c['primary']}80,
+            inset 0 2px 4px rgba(255,255,255,0.3);
+    }}
+
+    .timer-inner {{
+        background: linear-gradient(145deg, {c['bg_mid']}, {c['bg_light']});
+        border-radius: 50%;
+        display: flex;
+        align-items: center;
+        justify-content: center;
+    }}
+
+    .timer-text {{
+        font-family: 'Poppins', sans-serif;
+        font-weight: 800;
+        color: {c['primary']};
+        font-size: 1.5rem;
+    }}
+
+    /* Hint box */
+    .hint-box {{
+        background: linear-gradient(145deg, {c['text_light']}, {c['primary_light']}20);
+        border: 2px solid {c['primary']};
+        border-radius: 12px;
+        padding: 16px 24px;
+        animation: floatUp 0.5s ease-out;
+    }}
+
+    /* Answer reveal */
+    .answer-box {{
+        background: linear-gradient(145deg, {c['secondary']}20, {c['secondary']}10);
+        border: 2px solid {c['secondary']};
+        border-radius: 12px;
+        padding: 16px 24px;
+        animation: floatUp 0.5s ease-out;
+    }}
+
+    /* Countdown overlay */
+    .countdown-overlay {{
+        position: absolute;
+        top: 50%;
+        left: 50%;
+        transform: translate(-50%, -50%);
+        font-family: 'Rozha One', serif;
+        font-size: 8rem;
+        font-weight: 400;
+        color: {c['accent']};
+        text-shadow:
+            0 0 40px {c['accent']}cc,
+            0 0 80px {c['accent']}66,
+            0 4px 0 {c['accent_dark']};
+        z-index: 100;
+        pointer-events: none;
+        animation: countdownPulse 1s ease-in-out infinite;
+    }}
+
+    .image-area-container {{
+        position: relative;
+    }}
+
+    .star {{
+        color: {c['primary']};
+        animation: twinkle 1.5s ease-in-out infinite;
+    }}
+
+    /* Progress indicator */
+    .progress-dots {{
+        display: flex;
+        gap: 8px;
+        justify-content: center;
+    }}
+
+    .progress-dot {{
+        width: 12px;
+        height: 12px;
+        border-radius: 50%;
+        background: {c['primary']}4d;
+        transition: all 0.3s ease;
+    }}
+
+    .progress-dot.completed {{
+        background: {c['primary']};
+        box-shadow: 0 0 10px {c['primary']}80;
+    }}
+
+    .progress-dot.current {{
+        background: {c['accent']};
+        box-shadow: 0 0 15px {c['accent']}99;
+        animation: glowPulse 2s infinite;
+    }}
+
+    /* Feature 1: Clickable dots for history navigation */
+    .progress-dot.clickable {{
+        cursor: pointer;
+        transition: transform 0.2s, box-shadow 0.2s;
+    }}
+
+    .progress-dot.clickable:hover {{
+        transform: scale(1.3);
+        box-shadow: 0 0 15px {c['primary']};
+    }}
+
+    .progress-dot.reviewing {{
+        background: {c['secondary']} !important;
+        box-shadow: 0 0 15px {c['secondary']}99;
+        animation: glowPulse 2s infinite;
+    }}
+
+    /* Feature 2: Clickable timer */
+    .timer-clickable {{
+        cursor: pointer;
+        transition: transform 0.2s, box-shadow 0.2s;
+    }}
+
+    .timer-clickable:hover {{
+        transform: scale(1.1);
+    }}
+
+    .timer-clickable:active {{
+        transform: scale(0.95);
+    }}
+
+    /* Progressive reveal blur, driven entirely by CSS */
+    .game-image.progressive-blur {{
+        animation: progressiveBlur var(--blur-duration, 50s) linear var(--blur-delay, 0s) both;
+    }}
+
+    .game-image.progressive-blur.blur-paused {{
+        animation-play-state: paused;
+    }}
+
+    .game-image.progressive-blur.blur-clear {{
+        animation: none;
+        filter: none;
+    }}
+
+    /* Feature 3: Clickable image */
+    .image-clickable {{
+        cursor: pointer;
+        transition: box-shadow 0.2s;
+    }}
+
+    .image-clickable:hover {{
+        box-shadow: 0 10px 50px rgba(0,0,0,0.5);
+    }}
+
+    /* Feature 1: Review mode indicator */
+    .review-indicator {{
+        display: flex;
+        justify-content: center;
+        align-items: center;
+        gap: 12px;
+        flex-wrap: wrap;
+    }}
+
+    .review-badge {{
+        background: linear-gradient(135deg, {c['secondary']}, {c['secondary']}cc);
+        color: white;
+        font-size: clamp(0.8rem, 3vw, 1rem);
+        font-weight: 700;
+        padding: 6px 16px;
+        border-radius: 25px;
+        box-shadow: 0 3px 10px rgba(0,0,0,0.3);
+    }}
+
+    .back-btn {{
+        background: linear-gradient(135deg, #FF7043, #E64A19);
+        color: white;
+        font-family: 'Poppins', sans-serif;
+        font-size: clamp(0.7rem, 2.5vw, 0.85rem);
+        font-weight: 600;
+        padding: 6px 14px;
+        border-radius: 20px;
+        border: none;
+        cursor: pointer;
+        box-shadow: 0 2px 8px rgba(0,0,0,0.2);
+        transition: transform 0.2s, box-shadow 0.2s;
+    }}
+
+    .back-btn:hover {{
+        transform: translateY(-2px);
+        box-shadow: 0 4px 12px rgba(0,0,0,0.3);
+    }}
+
+    .back-btn:active {{
+        transform: scale(0.95);
+    }}
+
+    /* Confetti */
+    .confetti {{
+        position: fixed;
+        width: 10px;
+        height: 10px;
+        z-index: 1001;
+        animation: confettiFall 3s linear forwards;
+    }}
+
+    /* Game over celebration */
+    .celebration-container {{
+        animation: floatUp 0.8s ease-out;
+    }}
+
+    .trophy-icon {{
+        font-size: 6rem;
+        animation: glowPulse 2s infinite;
+    }}
+
+    /* Theme toggle buttons */
+    .theme-toggle-btn {{
+        font-family: 'Poppins', sans-serif;
+        font-weight: 600;
+        font-size: 0.85rem;
+        padding: 8px 16px;
+        border-radius: 20px;
+        cursor: pointer;
+        transition: all 0.3s ease;
+        touch-action: manipulation;
+    }}
+
+    .theme-toggle-btn.inactive {{
+        background: transparent;
+        border: 2px solid {c['primary']}66;
+        color: {c['text_dark']};
+        opacity: 0.7;
+    }}
+
+    .theme-toggle-btn.active {{
+        background: linear-gradient(145deg, {c['primary_light']}, {c['primary']});
+        border: 2px solid {c['primary']};
+        color: {c['text_dark']};
+        box-shadow: 0 2px 10px {c['primary']}66;
+    }}
+
+    .theme-toggle-btn:hover {{
+        transform: scale(1.05);
+    }}
+
+    /* ===== CATEGORY / SUBCATEGORY CARDS ===== */
+    .category-card {{
+        background: linear-gradient(145deg, {c['bg_mid']}ee, {c['bg_light']}ee);
+        border: 2px solid {c['primary']}44;
+        border-radius: 16px;
+        padding: 20px 24px;
+        cursor: pointer;
+        transition: all 0.3s cubic-bezier(0.4, 0, 0.2, 1);
+        text-align: center;
+        min-width: 140px;
+        max-width: 180px;
+        touch-action: manipulation;
+        -webkit-tap-highlight-color: transparent;
+    }}
+
+    .category-card:hover {{
+        transform: translateY(-4px) scale(1.03);
+        border-color: {c['primary']}88;
+        box-shadow: 0 8px 30px rgba(0,0,0,0.3), 0 0 20px {c['primary']}33;
+    }}
+
+    .category-card:active {{
+        transform: scale(0.97);
+    }}
+
+    .category-card .card-icon {{
+        font-size: 2.5rem;
+        margin-bottom: 8px;
+        display: block;
+    }}
+
+    .category-card .card-name {{
+        font-family: 'Poppins', sans-serif;
+        font-weight: 700;
+        font-size: 1.1rem;
+        color: {c['text_light']};
+        margin-bottom: 4px;
+    }}
+
+    .category-card .card-desc {{
+        font-family: 'Poppins', sans-serif;
+        font-size: 0.75rem;
+        color: {c['text_light']};
+        opacity: 0.7;
+    }}
+
+    .category-card .card-count {{
+        font-family: 'Poppins', sans-serif;
+        font-size: 0.7rem;
+        color: {c['primary']};
+        font-weight: 600;
+        margin-top: 6px;
+    }}
+
+    .subcategory-card {{
+        background: linear-gradient(145deg, {c['bg_mid']}ee, {c['bg_light']}ee);
+        border: 2px solid {c['primary']}44;
+        border-radius: 14px;
+        padding: 16px 20px;
+        cursor: pointer;
+        transition: all 0.3s cubic-bezier(0.4, 0, 0.2, 1);
+        text-align: center;
+        min-width: 120px;
+        touch-action: manipulation;
+        -webkit-tap-highlight-color: transparent;
+    }}
+
+    .subcategory-card:hover {{
+        transform: translateY(-3px) scale(1.02);
+        border-color: {c['primary']}88;
+        box-shadow: 0 6px 25px rgba(0,0,0,0.3), 0 0 15px {c['primary']}33;
+    }}
+
+    .subcategory-card:active {{
+        transform: scale(0.97);
+    }}
+
+    .subcategory-card .card-icon {{
+        font-size: 2rem;
+        margin-bottom: 6px;
+        display: block;
+    }}
+
+    .subcategory-card .card-name {{
+        font-family: 'Poppins', sans-serif;
+        font-weight: 700;
+        font-size: 1rem;
+        color: {c['text_light']};
+    }}
+
+    .subcategory-card .card-count {{
+        font-family: 'Poppins', sans-serif;
+        font-size: 0.7rem;
+        color: {c['primary']};
+        font-weight: 600;
+        margin-top: 4px;
+    }}
+
+    /* Step dots progress indicator */
+    .step-dots {{
+        display: flex;
+        gap: 10px;
+        justify-content: center;
+        align-items: center;
+        margin: 8px 0;
+    }}
+
+    .step-dot {{
+        width: 10px;
+        height: 10px;
+        border-radius: 50%;
+        background: {c['primary']}33;
+        transition: all 0.3s ease;
+    }}
+
+    .step-dot.active {{
+        background: {c['primary']};
+        box-shadow: 0 0 10px {c['primary']}80;
+        transform: scale(1.2);
+    }}
+
+    .step-dot.completed {{
+        background: {c['secondary']};
+        box-shadow: 0 0 8px {c['secondary']}66;
+    }}
+
+    .step-connector {{
+        width: 24px;
+        height: 2px;
+        background: {c['primary']}33;
+        transition: background 0.3s ease;
+    }}
+
+    .step-connector.completed {{
+        background: {c['secondary']};
+    }}
+
+    /* Selected category badge */
+    .selected-badge {{
+        display: inline-flex;
+        align-items: center;
+        gap: 6px;
+        background: {c['primary']}22;
+        border: 1.5px solid {c['primary']}66;
+        border-radius: 20px;
+        padding: 4px 14px;
+        font-family: 'Poppins', sans-serif;
+        font-size: 0.85rem;
+        font-weight: 600;
+        color: {c['primary']};
+    }}
+
+    /* Section header with decorative lines */
+    .section-header {{
+        display: flex;
+        align-items: center;
+        gap: 12px;
+        width: 100%;
+        max-width: 400px;
+    }}
+
+    .section-header .line {{
+        flex: 1;
+        height: 1px;
+        background: linear-gradient(90deg, transparent, {c['primary']}66, transparent);
+    }}
+
+    .section-header .text {{
+        font-family: 'Poppins', sans-serif;
+        font-weight: 700;
+        font-size: clamp(0.65rem, 2.5vw, 0.8rem);
+        color: {c['primary']};
+        text-transform: uppercase;
+        letter-spacing: 2px;
+        white-space: nowrap;
+    }}
+
+    /* Back link */
+    .back-link {{
+        font-family: 'Poppins', sans-serif;
+        font-size: 0.85rem;
+        color: {c['primary']};
+        opacity: 0.7;
+        cursor: pointer;
+        transition: opacity 0.2s;
+        touch-action: manipulation;
+    }}
+
+    .back-link:hover {{
+        opacity: 1;
+    }}
+
+    /* ===== MOBILE RESPONSIVE STYLES ===== */
+    @media (max-width: 640px) {{
+        .countdown-overlay {{
+            font-size: 4rem !important;
         }}
 
-        /* Spotlight pulse */
-        @keyframes spotlightPulse {{
-            0%, 100% {{ opacity: 0.8; transform: scale(1); }}
-            50% {{ opacity: 1; transform: scale(1.02); }}
+        .main-title {{
+            font-size: 2rem;
         }}
 
-        /* Star twinkle */
-        @keyframes twinkle {{
-            0%, 100% {{ opacity: 1; transform: scale(1); }}
-            50% {{ opacity: 0.5; transform: scale(0.8); }}
+        .game-card {{
+            animation: none;
         }}
 
-        /* Float up */
-        @keyframes floatUp {{
-            0% {{ transform: translateY(100px); opacity: 0; }}
-            100% {{ transform: translateY(0); opacity: 1; }}
+        .bollywood-btn {{
+            padding: 6px 10px;
+            font-size: 0.7rem;
+            border-radius: 20px;
+            border-width: 1px;
+            letter-spacing: 0;
         }}
 
-        /* Glow pulse */
-        @keyframes glowPulse {{
-            0%, 100% {{ box-shadow: 0 0 20px {c['primary']}80; }}
-            50% {{ box-shadow: 0 0 40px {c['primary']}cc, 0 0 60px {c['accent']}66; }}
+        .timer-container {{
+            width: 50px !important;
+            height: 50px !important;
         }}
 
-        /* Film reel rotation */
-        @keyframes reelSpin {{
-            0% {{ transform: rotate(0deg); }}
-            100% {{ transform: rotate(360deg); }}
+        .timer-text {{
+            font-size: 0.95rem;
         }}
 
-        /* Countdown pulse */
-        @keyframes countdownPulse {{
-            0%, 100% {{ transform: translate(-50%, -50%) scale(1); }}
-            50% {{ transform: translate(-50%, -50%) scale(1.1); }}
+        .trophy-icon {{
+            font-size: 4rem;
         }}
 
-        /* Confetti fall */
-        @keyframes confettiFall {{
-            0% {{ transform: translateY(-100vh) rotate(0deg); opacity: 1; }}
-            100% {{ transform: translateY(100vh) rotate(720deg); opacity: 0; }}
+        .game-card {{
+            border-radius: 12px;
+            margin: 0 !important;
         }}
 
-        /* ===== COMPONENT STYLES ===== */
+        .movie-frame {{
+            box-shadow:
+                0 5px 20px rgba(0,0,0,0.4),
+                0 0 0 2px {c['primary']},
+                0 0 0 4px {c['bg_mid']};
+        }}
 
-        /* Main title with primary gradient */
-        .main-title {{
-            font-family: 'Rozha One', serif !important;
-            font-size: 3.5rem;
-            background: linear-gradient(
-                90deg,
-                {c['primary']} 0%,
-                {c['primary_light']} 25%,
-                {c['primary']} 50%,
-                {c['primary_light']} 75%,
-                {c['primary']} 100%
-            );
-            background-size: 200% auto;
-            -webkit-background-clip: text;
-            -webkit-text-fill-color: transparent;
-            background-clip: text;
-            animation: primaryShimmer 3s linear infinite;
-            text-shadow: none;
-            filter: drop-shadow(0 2px 4px rgba(0,0,0,0.3));
+        .progress-dot {{
+            width: 8px;
+            height: 8px;
         }}
 
-        /* Subtitle styling */
-        .subtitle {{
-            font-family: 'Poppins', sans-serif;
-            color: {c['text_light']};
-            font-size: 1.1rem;
-            letter-spacing: 4px;
-            text-transform: uppercase;
-            opacity: 0.9;
+        .hint-box, .answer-box {{
+            padding: 4px 8px;
+            border-radius: 6px;
         }}
 
-        /* Game card with spotlight effect */
-        .game-card {{
-            background: linear-gradient(145deg, rgba(255,248,231,0.98), rgba(255,248,231,0.92));
-            border-radius: 24px;
-            box-shadow:
-                0 25px 50px rgba(0,0,0,0.4),
-                0 0 100px {c['primary']}33,
-                inset 0 1px 0 rgba(255,255,255,0.8);
-            animation: spotlightPulse 4s ease-in-out infinite;
-            border: 2px solid {c['primary']}4d;
+        .game-image {{
+            max-height: 50vh !important;
+            width: 100% !important;
         }}
 
-        /* Film strip decoration */
         .film-strip-border {{
-            background: repeating-linear-gradient(
-                90deg,
-                {c['bg_mid']} 0px,
-                {c['bg_mid']} 10px,
-                {c['primary']} 10px,
-                {c['primary']} 12px,
-                {c['bg_mid']} 12px,
-                {c['bg_mid']} 22px
-            );
-            height: 12px;
-            border-radius: 12px 12px 0 0;
+            height: 6px;
         }}
 
-        /* Theme button base */
-        .bollywood-btn {{
-            font-family: 'Poppins', sans-serif;
-            font-weight: 600;
-            font-size: 0.75rem;
-            padding: 8px 18px;
-            border-radius: 25px;
-            border: 1.5px solid {c['primary']};
-            text-transform: uppercase;
-            letter-spacing: 1px;
-            cursor: pointer;
-            transition: all 0.3s cubic-bezier(0.4, 0, 0.2, 1);
-            box-shadow:
-                0 2px 8px rgba(0,0,0,0.2),
-                inset 0 1px 0 rgba(255,255,255,0.3);
-            touch-action: manipulation;
-            -webkit-tap-highlight-color: transparent;
-            -webkit-touch-callout: none;
-            user-select: none;
+        .progress-dots {{
+            gap: 4px;
         }}
 
-        .bollywood-btn:hover {{
-            transform: translateY(-2px) scale(1.02);
-            box-shadow:
-                0 8px 25px rgba(0,0,0,0.4),
-                0 0 20px {c['primary']}66;
+        .image-area-container {{
+            padding-top: 0 !important;
+            padding-bottom: 0 !important;
+            min-height: 100px !important;
         }}
 
-        .bollywood-btn:active {{
-            transform: translateY(0) scale(0.98);
+        .theme-toggle-btn {{
+            font-size: 0.75rem;
+            padding: 6px 12px;
         }}
 
-        @media (pointer: coarse) {{
-            .bollywood-btn:active {{
-                transform: scale(0.95);
-            }}
+        .category-card {{
+            min-width: 100px;
+            max-width: 140px;
+            padding: 14px 16px;
+            border-radius: 12px;
         }}
 
-        /* Button variants */
-        .btn-gold {{
-            background: linear-gradient(145deg, {c['primary_light']}, {c['primary']}, {c['primary_dark']});
-            color: {c['text_dark']};
+        .category-card .card-icon {{
+            font-size: 2rem;
         }}
 
-        .btn-magenta {{
-            background: linear-gradient(145deg, {c['accent']}, {c['accent']}dd, {c['accent_dark']});
-            color: white;
+        .category-card .card-name {{
+            font-size: 0.9rem;
         }}
 
-        .btn-turquoise {{
-            background: linear-gradient(145deg, {c['secondary']}, {c['secondary']}dd, {c['secondary']}aa);
-            color: white;
+        .subcategory-card {{
+            min-width: 100px;
+            padding: 12px 16px;
+            border-radius: 12px;
         }}
 
-        /* Movie frame */
-        .movie-frame {{
-            position: relative;
-            border-radius: 16px;
-            overflow: hidden;
-            box-shadow:
-                0 10px 40px rgba(0,0,0,0.4),
-                0 0 0 4px {c['primary']},
-                0 0 0 8px {c['bg_mid']},
-                0 0 60px {c['primary']}33;
+        .subcategory-card .card-icon {{
+            font-size: 1.6rem;
         }}
 
-        /* Timer styling */
-        .timer-container {{
-            background: linear-gradient(145deg, {c['primary']}, {c['primary_dark']});
-            border-radius: 50%;
-            padding: 4px;
-            box-shadow:
-                0 4px 20px {c['primary']}80,
-                inset 0 2px 4px rgba(255,255,255,0.3);
+        .step-dots {{
+            gap: 6px;
         }}
 
-        .timer-inner {{
-            background: linear-gradient(145deg, {c['bg_mid']}, {c['bg_light']});
-            border-radius: 50%;
-            display: flex;
-            align-items: center;
-            justify-content: center;
+        .step-dot {{
+            width: 8px;
+            height: 8px;
         }}
 
-        .timer-text {{
-            font-family: 'Poppins', sans-serif;
-            font-weight: 800;
-            color: {c['primary']};
-            font-size: 1.5rem;
+        .step-connector {{
+            width: 16px;
         }}
-
-        /* Hint box */
-        .hint-box {{
-            background: linear-gradient(145deg, {c['text_light']}, {c['primary_light']}20);
-            border: 2px solid {c['primary']};
-            border-radius: 12px;
-            padding: 16px 24px;
-            animation: floatUp 0.5s ease-out;
+    }}
+
+    .mobile-icon-btn {{
+        box-shadow: 0 2px 8px rgba(0,0,0,0.3);
+        cursor: pointer;
+        transition: transform 0.2s ease, box-shadow 0.2s ease;
+    }}
+
+    .mobile-icon-btn:hover {{
+        transform: scale(1.1);
+        box-shadow: 0 4px 12px rgba(0,0,0,0.4);
+    }}
+
+    .mobile-icon-btn:active {{
+        transform: scale(0.95);
+    }}
+
+    /* Help icon */
+    .help-icon {{
+        width: 28px;
+        height: 28px;
+        border-radius: 50%;
+        background: linear-gradient(145deg, {c['primary_light']}, {c['primary']});
+        color: {c['text_dark']};
+        font-family: 'Poppins', sans-serif;
+        font-weight: 700;
+        font-size: 0.85rem;
+        display: flex;
+        align-items: center;
+        justify-content: center;
+        cursor: pointer;
+        border: 1.5px solid {c['primary_dark']};
+        box-shadow: 0 2px 6px rgba(0,0,0,0.2);
+        transition: transform 0.2s, box-shadow 0.2s;
+        touch-action: manipulation;
+        -webkit-tap-highlight-color: transparent;
+        flex-shrink: 0;
+    }}
+
+    .help-icon:hover {{
+        transform: scale(1.1);
+        box-shadow: 0 3px 10px {c['primary']}80;
+    }}
+
+    .help-icon:active {{
+        transform: scale(0.95);
+    }}
+
+    /* Help modal content */
+    .help-row {{
+        display: grid;
+        grid-template-columns: 28px auto 1fr;
+        align-items: center;
+        gap: 6px;
+        padding: 2px 0;
+    }}
+
+    .help-row-icon {{
+        font-size: 1.2rem;
+        text-align: center;
+    }}
+
+    .help-row-action {{
+        font-size: 0.95rem;
+        font-weight: 700;
+        color: {c['text_dark']};
+        font-family: 'Poppins', sans-serif;
+        white-space: nowrap;
+    }}
+
+    .help-row-desc {{
+        font-size: 0.9rem;
+        color: {c['text_dark']};
+        font-family: 'Poppins', sans-serif;
+        opacity: 0.75;
+        white-space: nowrap;
+    }}
+
+    .help-prose {{
+        font-family: 'Poppins', sans-serif;
+        font-size: 0.9rem;
+        color: {c['text_dark']};
+        line-height: 1.45;
+        margin: 2px 0;
+    }}
+
+    .help-card {{
+        max-height: 85vh;
+        overflow-y: auto;
+    }}
+
+    .help-section-divider {{
+        border: none;
+        border-top: 2px solid {c['primary']}44;
+        margin: 6px 0 4px 0;
+    }}
+
+    .help-section-label {{
+        font-family: 'Poppins', sans-serif;
+        font-weight: 700;
+        font-size: 0.85rem;
+        color: {c['primary_dark']};
+        text-transform: uppercase;
+        letter-spacing: 1px;
+        margin-top: 2px;
+    }}
+
+    @media (max-width: 640px) {{
+        .help-icon {{
+            width: 24px;
+            height: 24px;
+            font-size: 0.75rem;
         }}
 
-        /* Answer reveal */
-        .answer-box {{
-            background: linear-gradient(145deg, {c['secondary']}20, {c['secondary']}10);
-            border: 2px solid {c['secondary']};
-            border-radius: 12px;
-            padding: 16px 24px;
-            animation: floatUp 0.5s ease-out;
+        .help-card {{
+            padding: 16px 18px !important;
+            max-height: 80vh;
         }}
 
-        /* Countdown overlay */
-        .countdown-overlay {{
-            position: absolute;
-            top: 50%;
-            left: 50%;
-            transform: translate(-50%, -50%);
-            font-family: 'Rozha One', serif;
-            font-size: 8rem;
-            font-weight: 400;
-            color: {c['accent']};
-            text-shadow:
-                0 0 40px {c['accent']}cc,
-                0 0 80px {c['accent']}66,
-                0 4px 0 {c['accent_dark']};
-            z-index: 100;
-            pointer-events: none;
-            animation: countdownPulse 1s ease-in-out infinite;
+        .help-prose {{
+            font-size: 0.82rem;
+            line-height: 1.35;
         }}
 
-        .image-area-container {{
-            position: relative;
+        .help-section-label {{
+            font-size: 0.78rem;
+            margin-top: 0;
         }}
 
-        .star {{
-            color: {c['primary']};
-            animation: twinkle 1.5s ease-in-out infinite;
+        .help-section-divider {{
+            margin: 4px 0 2px 0;
         }}
 
-        /* Progress indicator */
-        .progress-dots {{
-            display: flex;
-            gap: 8px;
-            justify-content: center;
+        .help-row {{
+            grid-template-columns: 24px auto 1fr;
+            gap: 5px;
+            padding: 1px 0;
         }}
 
-        .progress-dot {{
-            width: 12px;
-            height: 12px;
-            border-radius: 50%;
-            background: {c['primary']}4d;
-            transition: all 0.3s ease;
+        .help-row-icon {{
+            font-size: 1rem;
         }}
 
-        .progress-dot.completed {{
-            background: {c['primary']};
-            box-shadow: 0 0 10px {c['primary']}80;
+        .help-row-action {{
+            font-size: 0.85rem;
         }}
 
-        .progress-dot.current {{
-            background: {c['accent']};
-            box-shadow: 0 0 15px {c['accent']}99;
-            animation: glowPulse 2s infinite;
+        .help-row-desc {{
+            font-size: 0.8rem;
         }}
+    }}
+    '''
 
-        /* Feature 1: Clickable dots for history navigation */
-        .progress-dot.clickable {{
-            cursor: pointer;
-            transition: transform 0.2s, box-shadow 0.2s;
-        }}
 
-        .progress-dot.clickable:hover {{
-            transform: scale(1.3);
-            box-shadow: 0 0 15px {c['primary']};
-        }}
+# Audio, round clock and confetti helpers (the same for every theme)
+GAME_SCRIPT = '''
+    let audioCtx = null;
+
+    // Round clock: the server sends the remaining time once when a round
+    // (re)starts; the browser animates the timer, countdown and ticks.
+    // (The blur is a CSS animation - see .progressive-blur.)
+    let roundClock = null;
+
+    function startRoundClock(secondsLeft) {
+        stopRoundClock();
+        const deadline = performance.now() + secondsLeft * 1000;
+        let lastShown = null;
+
+        function tick() {
+            const remaining = Math.max(0, Math.ceil((deadline - performance.now()) / 1000));
+            if (remaining === lastShown) return;
+            const firstTick = lastShown === null;
+            lastShown = remaining;
+
+            showRoundClock(remaining);
+
+            if (remaining <= 0) {
+                stopRoundClock();  // The server handles the timeout itself
+                return;
+            }
+            const overlay = document.querySelector('.countdown-overlay');
+            if (remaining <= 10) {
+                if (overlay) {
+                    overlay.textContent = remaining;
+                    overlay.style.display = 'block';
+                }
+                if (!firstTick) playTick(remaining);
+            } else if (overlay) {
+                overlay.style.display = 'none';
+            }
+        }
 
-        .progress-dot.reviewing {{
-            background: {c['secondary']} !important;
-            box-shadow: 0 0 15px {c['secondary']}99;
-            animation: glowPulse 2s infinite;
-        }}
+        tick();
+        roundClock = setInterval(tick, 200);
+    }
 
-        /* Feature 2: Clickable timer */
-        .timer-clickable {{
-            cursor: pointer;
-            transition: transform 0.2s, box-shadow 0.2s;
-        }}
+    function showRoundClock(secondsLeft) {
+        const display = document.querySelector('.timer-text');
+        if (!display) return;
+        const seconds = Math.ceil(secondsLeft);
+        display.textContent = Math.floor(seconds / 60) + ':' + String(seconds % 60).padStart(2, '0');
+    }
 
-        .timer-clickable:hover {{
-            transform: scale(1.1);
-        }}
+    function stopRoundClock() {
+        if (roundClock !== null) clearInterval(roundClock);
+        roundClock = null;
+        const overlay = document.querySelector('.countdown-overlay');
+        if (overlay) overlay.style.display = 'none';
+    }
 
-        .timer-clickable:active {{
-            transform: scale(0.95);
-        }}
+    function showTimeUp() {
+        const overlay = document.querySelector('.countdown-overlay');
+        if (!overlay) return;
+        overlay.textContent = '⏰';
+        overlay.style.fontSize = '4rem';
+        overlay.style.display = 'block';
+        setTimeout(() => {
+            overlay.style.display = 'none';
+            overlay.style.fontSize = '';
+        }, 2000);
+    }
 
-        /* Feature 3: Clickable image */
-        .image-clickable {{
-            cursor: pointer;
-            transition: box-shadow 0.2s;
-        }}
+    // Tell the server when the tab goes to the background so it can pause and release the round
+    document.addEventListener('visibilitychange', () => {
+        emitEvent('tab_visibility', {hidden: document.hidden});
+    });
 
-        .image-clickable:hover {{
-            box-shadow: 0 10px 50px rgba(0,0,0,0.5);
-        }}
+    // Next round's image, fetched and decoded while the current round plays
+    let preloadedImage = null;
 
-        /* Feature 1: Review mode indicator */
-        .review-indicator {{
-            display: flex;
-            justify-content: center;
-            align-items: center;
-            gap: 12px;
-            flex-wrap: wrap;
-        }}
+    function preloadImage(src, srcset, sizes) {
+        const image = new Image();
+        if (srcset) {
+            image.sizes = sizes;  // Set before srcset so the right width is picked
+            image.srcset = srcset;
+        }
+        image.src = src;
+        image.decode().catch(() => {});
+        preloadedImage = image;  // Keep it referenced so the decoded image stays in memory
+    }
 
-        .review-badge {{
-            background: linear-gradient(135deg, {c['secondary']}, {c['secondary']}cc);
-            color: white;
-            font-size: clamp(0.8rem, 3vw, 1rem);
-            font-weight: 700;
-            padding: 6px 16px;
-            border-radius: 25px;
-            box-shadow: 0 3px 10px rgba(0,0,0,0.3);
-        }}
+    function detachSession(resumeUrl) {
+        // The server has parked this game; reconnect through resumeUrl once the tab is looked at again
+        stopRoundClock();
+        document.addEventListener('visibilitychange', () => {
+            if (!document.hidden) window.location.replace(resumeUrl);
+        });
+        if (window.socket) window.socket.disconnect();
+    }
 
-        .back-btn {{
-            background: linear-gradient(135deg, #FF7043, #E64A19);
-            color: white;
-            font-family: 'Poppins', sans-serif;
-            font-size: clamp(0.7rem, 2.5vw, 0.85rem);
-            font-weight: 600;
-            padding: 6px 14px;
-            border-radius: 20px;
-            border: none;
-            cursor: pointer;
-            box-shadow: 0 2px 8px rgba(0,0,0,0.2);
-            transition: transform 0.2s, box-shadow 0.2s;
-        }}
+    function playTick(timeLeft) {
+        if (!audioCtx) audioCtx = new (window.AudioContext || window.webkitAudioContext)();
 
-        .back-btn:hover {{
-            transform: translateY(-2px);
-            box-shadow: 0 4px 12px rgba(0,0,0,0.3);
-        }}
+        const osc = audioCtx.createOscillator();
+        const gain = audioCtx.createGain();
 
-        .back-btn:active {{
-            transform: scale(0.95);
-        }}
+        const freq = 880 + (10 - timeLeft) * 44;
+        osc.type = 'sine';
+        osc.frequency.value = freq;
 
-        /* Confetti */
-        .confetti {{
-            position: fixed;
-            width: 10px;
-            height: 10px;
-            z-index: 1001;
-            animation: confettiFall 3s linear forwards;
-        }}
+        const duration = 0.08 + (timeLeft / 10) * 0.12;
 
-        /* Game over celebration */
-        .celebration-container {{
-            animation: floatUp 0.8s ease-out;
-        }}
+        gain.gain.setValueAtTime(0, audioCtx.currentTime);
+        gain.gain.linearRampToValueAtTime(0.2, audioCtx.currentTime + 0.01);
+        gain.gain.setValueAtTime(0.2, audioCtx.currentTime + duration - 0.02);
+        gain.gain.linearRampToValueAtTime(0, audioCtx.currentTime + duration);
 
-        .trophy-icon {{
-            font-size: 6rem;
-            animation: glowPulse 2s infinite;
-        }}
+        osc.connect(gain);
+        gain.connect(audioCtx.destination);
 
-        /* Theme toggle buttons */
-        .theme-toggle-btn {{
-            font-family: 'Poppins', sans-serif;
-            font-weight: 600;
-            font-size: 0.85rem;
-            padding: 8px 16px;
-            border-radius: 20px;
-            cursor: pointer;
-            transition: all 0.3s ease;
-            touch-action: manipulation;
-        }}
+        osc.start();
+        osc.stop(audioCtx.currentTime + duration);
+    }
 
-        .theme-toggle-btn.inactive {{
-            background: transparent;
-            border: 2px solid {c['primary']}66;
-            color: {c['text_dark']};
-            opacity: 0.7;
-        }}
+    function playVictory() {
+        if (!audioCtx) audioCtx = new (window.AudioContext || window.webkitAudioContext)();
 
-        .theme-toggle-btn.active {{
-            background: linear-gradient(145deg, {c['primary_light']}, {c['primary']});
-            border: 2px solid {c['primary']};
-            color: {c['text_dark']};
-            box-shadow: 0 2px 10px {c['primary']}66;
-        }}
+        const notes = [523, 659, 784, 1047];
+        const now = audioCtx.currentTime;
 
-        .theme-toggle-btn:hover {{
-            transform: scale(1.05);
-        }}
+        notes.forEach((freq, i) => {
+            const osc = audioCtx.createOscillator();
+            const gain = audioCtx.createGain();
 
-        /* ===== CATEGORY / SUBCATEGORY CARDS ===== */
-        .category-card {{
-            background: linear-gradient(145deg, {c['bg_mid']}ee, {c['bg_light']}ee);
-            border: 2px solid {c['primary']}44;
-            border-radius: 16px;
-            padding: 20px 24px;
-            cursor: pointer;
-            transition: all 0.3s cubic-bezier(0.4, 0, 0.2, 1);
-            text-align: center;
-            min-width: 140px;
-            max-width: 180px;
-            touch-action: manipulation;
-            -webkit-tap-highlight-color: transparent;
-        }}
+            osc.type = 'sine';
+            osc.frequency.value = freq;
 
-        .category-card:hover {{
-            transform: translateY(-4px) scale(1.03);
-            border-color: {c['primary']}88;
-            box-shadow: 0 8px 30px rgba(0,0,0,0.3), 0 0 20px {c['primary']}33;
-        }}
+            const startTime = now + i * 0.1;
+            gain.gain.setValueAtTime(0, startTime);
+            gain.gain.linearRampToValueAtTime(0.15, startTime + 0.05);
+            gain.gain.setValueAtTime(0.15, startTime + 0.3);
+            gain.gain.linearRampToValueAtTime(0, startTime + 0.6);
 
-        .category-card:active {{
-            transform: scale(0.97);
-        }}
+            osc.connect(gain);
+            gain.connect(audioCtx.destination);
 
-        .category-card .card-icon {{
-            font-size: 2.5rem;
-            margin-bottom: 8px;
-            display: block;
-        }}
+            osc.start(startTime);
+            osc.stop(startTime + 0.7);
+        });
+    }
 
-        .category-card .card-name {{
-            font-family: 'Poppins', sans-serif;
-            font-weight: 700;
-            font-size: 1.1rem;
-            color: {c['text_light']};
-            margin-bottom: 4px;
-        }}
+    function createConfetti(themeColors) {
+        const colors = themeColors;
 
-        .category-card .card-desc {{
-            font-family: 'Poppins', sans-serif;
-            font-size: 0.75rem;
-            color: {c['text_light']};
-            opacity: 0.7;
-        }}
+        for (let i = 0; i < 50; i++) {
+            const confetti = document.createElement('div');
+            confetti.className = 'confetti';
+            confetti.style.left = Math.random() * 100 + 'vw';
+            confetti.style.background = colors[Math.floor(Math.random() * colors.length)];
+            confetti.style.animationDelay = Math.random() * 2 + 's';
+            confetti.style.animationDuration = (2 + Math.random() * 2) + 's';
+            document.body.appendChild(confetti);
 
-        .category-card .card-count {{
-            font-family: 'Poppins', sans-serif;
-            font-size: 0.7rem;
-            color: {c['primary']};
-            font-weight: 600;
-            margin-top: 6px;
-        }}
+            setTimeout(() => confetti.remove(), 5000);
+        }
+    }
+'''
 
-        .subcategory-card {{
-            background: linear-gradient(145deg, {c['bg_mid']}ee, {c['bg_light']}ee);
-            border: 2px solid {c['primary']}44;
-            border-radius: 14px;
-            padding: 16px 20px;
-            cursor: pointer;
-            transition: all 0.3s cubic-bezier(0.4, 0, 0.2, 1);
-            text-align: center;
-            min-width: 120px;
-            touch-action: manipulation;
-            -webkit-tap-highlight-color: transparent;
-        }}
 
-        .subcategory-card:hover {{
-            transform: translateY(-3px) scale(1.02);
-            border-color: {c['primary']}88;
-            box-shadow: 0 6px 25px rgba(0,0,0,0.3), 0 0 15px {c['primary']}33;
-        }}
+def generate_body_bg(theme_colors):
+    """Generate body background CSS for theme."""
+    c = theme_colors
+    return f'''
+        background:
+            radial-gradient(ellipse at top, {c['primary']}1a 0%, transparent 50%),
+            radial-gradient(ellipse at bottom, {c['accent']}1a 0%, transparent 50%),
+            linear-gradient(180deg, {c['bg_dark']} 0%, {c['bg_mid']} 50%, {c['bg_light']} 100%);
+        min-height: 100vh;
+    '''
 
-        .subcategory-card:active {{
-            transform: scale(0.97);
-        }}
 
-        .subcategory-card .card-icon {{
-            font-size: 2rem;
-            margin-bottom: 6px;
-            display: block;
-        }}
+class ThemeVars:
+    """Stands in for a colors dict in the CSS templates, yielding CSS variable references."""
 
-        .subcategory-card .card-name {{
-            font-family: 'Poppins', sans-serif;
-            font-weight: 700;
-            font-size: 1rem;
-            color: {c['text_light']};
-        }}
+    def __getitem__(self, name):
+        return f'var(--theme-{name})'
 
-        .subcategory-card .card-count {{
-            font-family: 'Poppins', sans-serif;
-            font-size: 0.7rem;
-            color: {c['primary']};
-            font-weight: 600;
-            margin-top: 4px;
-        }}
 
-        /* Step dots progress indicator */
-        .step-dots {{
-            display: flex;
-            gap: 10px;
-            justify-content: center;
-            align-items: center;
-            margin: 8px 0;
-        }}
+# A palette reference, optionally followed by a two-digit hex alpha as in `{c['primary']}33`
+THEME_VAR_PATTERN = re.compile(r'var\(--theme-(\w+?)\)([0-9a-fA-F]{2})?(?![0-9a-fA-F])')
 
-        .step-dot {{
-            width: 10px;
-            height: 10px;
-            border-radius: 50%;
-            background: {c['primary']}33;
-            transition: all 0.3s ease;
-        }}
 
-        .step-dot.active {{
-            background: {c['primary']};
-            box-shadow: 0 0 10px {c['primary']}80;
-            transform: scale(1.2);
-        }}
+def generate_theme_css():
+    """Generate the one stylesheet shared by every theme.
 
-        .step-dot.completed {{
-            background: {c['secondary']};
-            box-shadow: 0 0 8px {c['secondary']}66;
-        }}
+    The rules reference the palette only through CSS variables, and each theme
+    is a `.theme-<key>` class defining them, so switching themes is a single
+    class change on <body>. Alpha-suffixed colors become variables of their own.
+    """
+    used = set()
 
-        .step-connector {{
-            width: 24px;
-            height: 2px;
-            background: {c['primary']}33;
-            transition: background 0.3s ease;
-        }}
+    def to_var(match):
+        name, alpha = match.group(1), match.group(2) or ''
+        used.add((name, alpha))
+        return f'var(--theme-{name}-{alpha})' if alpha else f'var(--theme-{name})'
 
-        .step-connector.completed {{
-            background: {c['secondary']};
-        }}
+    palette = ThemeVars()
+    rules = f'body {{{generate_body_bg(palette)}}}\n' + generate_theme_rules(palette)
+    rules = THEME_VAR_PATTERN.sub(to_var, rules)
 
-        /* Selected category badge */
-        .selected-badge {{
-            display: inline-flex;
-            align-items: center;
-            gap: 6px;
-            background: {c['primary']}22;
-            border: 1.5px solid {c['primary']}66;
-            border-radius: 20px;
-            padding: 4px 14px;
-            font-family: 'Poppins', sans-serif;
-            font-size: 0.85rem;
-            font-weight: 600;
-            color: {c['primary']};
-        }}
+    theme_blocks = []
+    for theme_key, theme in THEMES.items():
+        colors = theme['colors']
+        selector = f':root, .theme-{theme_key}' if theme_key == DEFAULT_THEME else f'.theme-{theme_key}'
+        declarations = ''.join(
+            f'\n    --theme-{name}{"-" + alpha if alpha else ""}: {colors[name]}{alpha};'
+            for name, alpha in sorted(used)
+        )
+        theme_blocks.append(f'{selector} {{{declarations}\n}}\n')
+    return ''.join(theme_blocks) + rules
 
-        /* Section header with decorative lines */
-        .section-header {{
-            display: flex;
-            align-items: center;
-            gap: 12px;
-            width: 100%;
-            max-width: 400px;
-        }}
 
-        .section-header .line {{
-            flex: 1;
-            height: 1px;
-            background: linear-gradient(90deg, transparent, {c['primary']}66, transparent);
-        }}
+def theme_class(theme_key):
+    """CSS class that applies a theme's palette."""
+    return f'theme-{theme_key}'
 
-        .section-header .text {{
-            font-family: 'Poppins', sans-serif;
-            font-weight: 700;
-            font-size: clamp(0.65rem, 2.5vw, 0.8rem);
-            color: {c['primary']};
-            text-transform: uppercase;
-            letter-spacing: 2px;
-            white-space: nowrap;
-        }}
 
-        /* Back link */
-        .back-link {{
-            font-family: 'Poppins', sans-serif;
-            font-size: 0.85rem;
-            color: {c['primary']};
-            opacity: 0.7;
-            cursor: pointer;
-            transition: opacity 0.2s;
-            touch-action: manipulation;
-        }}
+ALL_THEME_CLASSES = ' '.join(theme_class(theme_key) for theme_key in THEMES)
 
-        .back-link:hover {{
-            opacity: 1;
-        }}
 
-        /* ===== MOBILE RESPONSIVE STYLES ===== */
-        @media (max-width: 640px) {{
-            .countdown-overlay {{
-                font-size: 4rem !important;
-            }}
-
-            .main-title {{
-                font-size: 2rem;
-            }}
-
-            .game-card {{
-                animation: none;
-            }}
-
-            .bollywood-btn {{
-                padding: 6px 10px;
-                font-size: 0.7rem;
-                border-radius: 20px;
-                border-width: 1px;
-                letter-spacing: 0;
-            }}
-
-            .timer-container {{
-                width: 50px !important;
-                height: 50px !important;
-            }}
-
-            .timer-text {{
-                font-size: 0.95rem;
-            }}
-
-            .trophy-icon {{
-                font-size: 4rem;
-            }}
-
-            .game-card {{
-                border-radius: 12px;
-                margin: 0 !important;
-            }}
-
-            .movie-frame {{
-                box-shadow:
-                    0 5px 20px rgba(0,0,0,0.4),
-                    0 0 0 2px {c['primary']},
-                    0 0 0 4px {c['bg_mid']};
-            }}
-
-            .progress-dot {{
-                width: 8px;
-                height: 8px;
-            }}
-
-            .hint-box, .answer-box {{
-                padding: 4px 8px;
-                border-radius: 6px;
-            }}
-
-            .game-image {{
-                max-height: 50vh !important;
-                width: 100% !important;
-            }}
-
-            .film-strip-border {{
-                height: 6px;
-            }}
-
-            .progress-dots {{
-                gap: 4px;
-            }}
-
-            .image-area-container {{
-                padding-top: 0 !important;
-                padding-bottom: 0 !important;
-                min-height: 100px !important;
-            }}
-
-            .theme-toggle-btn {{
-                font-size: 0.75rem;
-                padding: 6px 12px;
-            }}
-
-            .category-card {{
-                min-width: 100px;
-                max-width: 140px;
-                padding: 14px 16px;
-                border-radius: 12px;
-            }}
-
-            .category-card .card-icon {{
-                font-size: 2rem;
-            }}
-
-            .category-card .card-name {{
-                font-size: 0.9rem;
-            }}
-
-            .subcategory-card {{
-                min-width: 100px;
-                padding: 12px 16px;
-                border-radius: 12px;
-            }}
-
-            .subcategory-card .card-icon {{
-                font-size: 1.6rem;
-            }}
-
-            .step-dots {{
-                gap: 6px;
-            }}
-
-            .step-dot {{
-                width: 8px;
-                height: 8px;
-            }}
-
-            .step-connector {{
-                width: 16px;
-            }}
-        }}
+# =============================================================================
+# STATIC ASSETS - Hashed, precompressed stylesheet and game script
+# =============================================================================
+try:
+    import brotli  # Optional: adds .br variants next to gzip
+except ImportError:
+    brotli = None
 
-        .mobile-icon-btn {{
-            box-shadow: 0 2px 8px rgba(0,0,0,0.3);
-            cursor: pointer;
-            transition: transform 0.2s ease, box-shadow 0.2s ease;
-        }}
+ASSET_ROUTE = '/assets'
+ASSET_CACHE_CONTROL = 'public, max-age=31536000, immutable'  # Names change whenever content does
 
-        .mobile-icon-btn:hover {{
-            transform: scale(1.1);
-            box-shadow: 0 4px 12px rgba(0,0,0,0.4);
-        }}
 
-        .mobile-icon-btn:active {{
-            transform: scale(0.95);
-        }}
+class StaticAsset:
+    """A precompiled text asset with its compressed variants, named by content hash."""
 
-        /* Help icon */
-        .help-icon {{
-            width: 28px;
-            height: 28px;
-            border-radius: 50%;
-            background: linear-gradient(145deg, {c['primary_light']}, {c['primary']});
-            color: {c['text_dark']};
-            font-family: 'Poppins', sans-serif;
-            font-weight: 700;
-            font-size: 0.85rem;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            cursor: pointer;
-            border: 1.5px solid {c['primary_dark']};
-            box-shadow: 0 2px 6px rgba(0,0,0,0.2);
-            transition: transform 0.2s, box-shadow 0.2s;
-            touch-action: manipulation;
-            -webkit-tap-highlight-color: transparent;
-            flex-shrink: 0;
-        }}
+    __slots__ = ('name', 'media_type', 'digest', 'variants')
 
-        .help-icon:hover {{
-            transform: scale(1.1);
-            box-shadow: 0 3px 10px {c['primary']}80;
-        }}
+    def __init__(self, stem, suffix, text, media_type):
+        body = text.encode('utf-8')
+        self.digest = hashlib.sha256(body).hexdigest()[:16]
+        self.name = f'{stem}.{self.digest}{suffix}'
+        self.media_type = media_type
+        self.variants = {'identity': body, 'gzip': gzip.compress(body, compresslevel=9, mtime=0)}
+        if brotli is not None:
+            self.variants['br'] = brotli.compress(body)
 
-        .help-icon:active {{
-            transform: scale(0.95);
-        }}
+    @property
+    def url(self):
+        return f'{ASSET_ROUTE}/{self.name}'
 
-        /* Help modal content */
-        .help-row {{
-            display: grid;
-            grid-template-columns: 28px auto 1fr;
-            align-items: center;
-            gap: 6px;
-            padding: 2px 0;
-        }}
+    def etag(self, encoding):
+        """Strong ETag for one encoded variant."""
+        return f'"{self.digest}"' if encoding == 'identity' else f'"{self.digest}-{encoding}"'
 
-        .help-row-icon {{
-            font-size: 1.2rem;
-            text-align: center;
-        }}
+    def negotiate(self, accept_encoding):
+        """Best variant the client accepts ('br', 'gzip' or 'identity')."""
+        accepted = {part.split(';')[0].strip() for part in accept_encoding.lower().split(',')}
+        for encoding in ('br', 'gzip'):
+            if encoding in self.variants and encoding in accepted:
+                return encoding
+        return 'identity'
 
-        .help-row-action {{
-            font-size: 0.95rem;
-            font-weight: 700;
-            color: {c['text_dark']};
-            font-family: 'Poppins', sans-serif;
-            white-space: nowrap;
-        }}
 
-        .help-row-desc {{
-            font-size: 0.9rem;
-            color: {c['text_dark']};
-            font-family: 'Poppins', sans-serif;
-            opacity: 0.75;
-            white-space: nowrap;
-        }}
+_static_assets = {}  # name -> StaticAsset
+_stylesheet = None
+_game_script = None
 
-        .help-prose {{
-            font-family: 'Poppins', sans-serif;
-            font-size: 0.9rem;
-            color: {c['text_dark']};
-            line-height: 1.45;
-            margin: 2px 0;
-        }}
 
-        .help-card {{
-            max-height: 85vh;
-            overflow-y: auto;
-        }}
+def build_static_assets():
+    """Precompile the stylesheet and the game script (once per process)."""
+    global _stylesheet, _game_script
+    if _game_script is not None:
+        return
+    _stylesheet = StaticAsset('theme', '.css', generate_theme_css(), 'text/css')
+    _game_script = StaticAsset('game', '.js', GAME_SCRIPT, 'text/javascript')
+    for asset in (_stylesheet, _game_script):
+        _static_assets[asset.name] = asset
 
-        .help-section-divider {{
-            border: none;
-            border-top: 2px solid {c['primary']}44;
-            margin: 6px 0 4px 0;
-        }}
 
-        .help-section-label {{
-            font-family: 'Poppins', sans-serif;
-            font-weight: 700;
-            font-size: 0.85rem;
-            color: {c['primary_dark']};
-            text-transform: uppercase;
-            letter-spacing: 1px;
-            margin-top: 2px;
-        }}
+def stylesheet_url():
+    """Hashed URL of the shared stylesheet."""
+    build_static_assets()
+    return _stylesheet.url
 
-        @media (max-width: 640px) {{
-            .help-icon {{
-                width: 24px;
-                height: 24px;
-                font-size: 0.75rem;
-            }}
-
-            .help-card {{
-                padding: 16px 18px !important;
-                max-height: 80vh;
-            }}
-
-            .help-prose {{
-                font-size: 0.82rem;
-                line-height: 1.35;
-            }}
-
-            .help-section-label {{
-                font-size: 0.78rem;
-                margin-top: 0;
-            }}
-
-            .help-section-divider {{
-                margin: 4px 0 2px 0;
-            }}
-
-            .help-row {{
-                grid-template-columns: 24px auto 1fr;
-                gap: 5px;
-                padding: 1px 0;
-            }}
-
-            .help-row-icon {{
-                font-size: 1rem;
-            }}
-
-            .help-row-action {{
-                font-size: 0.85rem;
-            }}
-
-            .help-row-desc {{
-                font-size: 0.8rem;
-            }}
-        }}
-    </style>
 
-    <script>
-        let audioCtx = null;
+def game_script_url():
+    """Hashed URL of the shared game script."""
+    build_static_assets()
+    return _game_script.url
 
-        function playTick(timeLeft) {{
-            if (!audioCtx) audioCtx = new (window.AudioContext || window.webkitAudioContext)();
 
-            const osc = audioCtx.createOscillator();
-            const gain = audioCtx.createGain();
+def generate_head_html():
+    """Head tags for a page: fonts, the stylesheet and the game script."""
+    return (
+        FONTS_HEAD_HTML
+        + f'<link rel="stylesheet" href="{stylesheet_url()}">\n'
+        + f'<script src="{game_script_url()}"></script>\n'
+    )
 
-            const freq = 880 + (10 - timeLeft) * 44;
-            osc.type = 'sine';
-            osc.frequency.value = freq;
+# =============================================================================
+# DATA LOADING
+# =============================================================================
+# Cell values pandas.read_csv treats as NaN by default; mirrored so hints and
+# other optional columns keep the same "missing" semantics without pandas.
+NA_VALUES = frozenset({
+    '', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan',
+    '1.#IND', '1.#QNAN', '<NA>', 'N/A', 'NA', 'NULL', 'NaN', 'None', 'n/a',
+    'nan', 'null',
+})
 
-            const duration = 0.08 + (timeLeft / 10) * 0.12;
 
-            gain.gain.setValueAtTime(0, audioCtx.currentTime);
-            gain.gain.linearRampToValueAtTime(0.2, audioCtx.currentTime + 0.01);
-            gain.gain.setValueAtTime(0.2, audioCtx.currentTime + duration - 0.02);
-            gain.gain.linearRampToValueAtTime(0, audioCtx.currentTime + duration);
+def is_missing(value):
+    """True for values that pandas would have loaded as NaN."""
+    return value is None or (isinstance(value, float) and value != value)
 
-            osc.connect(gain);
-            gain.connect(audioCtx.destination);
 
-            osc.start();
-            osc.stop(audioCtx.currentTime + duration);
-        }}
+def load_data(csv_file=None):
+    """Loads the CSV into a list of row dicts (lowercase column names, missing cells as None)."""
+    if csv_file is None:
+        csv_file = os.path.join(SCRIPT_DIR, THEMES[DEFAULT_THEME]['csv_file'])
+    if not os.path.exists(csv_file):
+        return []
+    with open(csv_file, newline='', encoding='utf-8-sig') as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if not header:
+            return []
+        columns = [c.strip().lower() for c in header]
+        rows = []
+        for values in reader:
+            if not values:
+                continue  # pandas skips blank lines
+            values += [''] * (len(columns) - len(values))
+            rows.append({
+                col: (None if val in NA_VALUES else val)
+                for col, val in zip(columns, values)
+            })
+    return rows
+
+
+IMAGE_EXTENSIONS = ('.webp', '.jpg', '.jpeg', '.png', '.gif', '.avif')
+
+_folder_snapshots = {}  # image_folder -> (folder mtime, frozenset of filenames)
+
+
+def list_image_folder(image_folder):
+    """Filenames in an image folder from a single os.scandir() pass, cached by folder mtime."""
+    try:
+        mtime = os.stat(image_folder).st_mtime_ns
+    except OSError:
+        return frozenset()
+    cached = _folder_snapshots.get(image_folder)
+    if cached and cached[0] == mtime:
+        return cached[1]
+    with os.scandir(image_folder) as entries:
+        names = frozenset(entry.name for entry in entries if entry.is_file())
+    _folder_snapshots[image_folder] = (mtime, names)
+    return names
+
+
+_file_digests = {}  # path -> (mtime_ns, size, digest)
+
+
+def file_digest(path):
+    """Content hash of a file (16 hex chars), re-read only when its mtime or size changes."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    cached = _file_digests.get(path)
+    if cached and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+        return cached[2]
+    with open(path, 'rb') as f:
+        digest = hashlib.file_digest(f, 'sha256').hexdigest()[:16]
+    _file_digests[path] = (stat.st_mtime_ns, stat.st_size, digest)
+    return digest
+
+
+def image_size(path):
+    """(width, height) read from a WebP, PNG, GIF or JPEG header, or None if unrecognised."""
+    try:
+        with open(path, 'rb') as f:
+            head = f.read(32)
+            if head[:4] == b'RIFF' and head[8:12] == b'WEBP':
+                chunk = head[12:16]
+                if chunk == b'VP8 ':  # Lossy: 14-bit sizes after the frame tag and start code
+                    width, height = struct.unpack('<HH', head[26:30])
+                    return width & 0x3FFF, height & 0x3FFF
+                if chunk == b'VP8L':  # Lossless: 14-bit sizes minus one, packed after the signature byte
+                    bits = struct.unpack('<I', head[21:25])[0]
+                    return (bits & 0x3FFF) + 1, ((bits >> 14) & 0x3FFF) + 1
+                if chunk == b'VP8X':  # Extended: 24-bit canvas sizes minus one
+                    return int.from_bytes(head[24:27], 'little') + 1, int.from_bytes(head[27:30], 'little') + 1
+                return None
+            if head[:8] == b'\x89PNG\r\n\x1a\n':
+                return struct.unpack('>II', head[16:24])
+            if head[:6] in (b'GIF87a', b'GIF89a'):
+                return struct.unpack('<HH', head[6:10])
+            if head[:2] == b'\xff\xd8':
+                f.seek(2)
+                while True:  # Walk the segments up to the start-of-frame marker
+                    marker = f.read(4)
+                    if len(marker) < 4 or marker[0] != 0xFF:
+                        return None
+                    length = struct.unpack('>H', marker[2:])[0]
+                    if 0xC0 <= marker[1] <= 0xCF and marker[1] not in (0xC4, 0xC8, 0xCC):
+                        height, width = struct.unpack('>xHH', f.read(5))
+                        return width, height
+                    f.seek(length - 2, os.SEEK_CUR)
+    except (OSError, struct.error):
+        pass
+    return None
+
+
+_image_meta = {}  # path -> (mtime_ns, size, (width, height, placeholder))
+
+
+def image_meta(path):
+    """(width, height, placeholder data URI) of a frame, re-read only when its mtime or size changes.
+
+    Any of the three is None when it can't be determined; the placeholder
+    needs Pillow (see frame_placeholder).
+    """
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None, None, None
+    cached = _image_meta.get(path)
+    if cached and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+        return cached[2]
+    width, height = image_size(path) or (None, None)
+    meta = (width, height, frame_placeholder(path))
+    _image_meta[path] = (stat.st_mtime_ns, stat.st_size, meta)
+    return meta
+
+
+def check_image_files(rows, image_folder):
+    """Match CSV rows against the image folder in one pass.
+
+    Returns (valid_rows, missing, orphaned): rows whose image exists, filenames
+    the CSV references but the folder lacks, and image files no row uses.
+    """
+    on_disk = list_image_folder(image_folder)
+    valid_rounds = []
+    missing = []
+    referenced = set()
+    matched_folded = set()  # Rows found only by os.path.exists (case-insensitive filesystems)
+    for row in rows:
+        filename = row.get('filename')
+        if is_missing(filename):
+            continue
+        referenced.add(filename)
+        if filename in on_disk:
+            valid_rounds.append(row)
+        elif os.path.exists(os.path.join(image_folder, filename)):
+            # Nested paths aren't in the flat listing, and on Windows/macOS the
+            # CSV may differ from the file name in case only
+            valid_rounds.append(row)
+            matched_folded.add(filename.casefold())
+        else:
+            missing.append(filename)
+    orphaned = sorted(
+        name for name in on_disk
+        if name not in referenced and name.casefold() not in matched_folded
+        and name.lower().endswith(IMAGE_EXTENSIONS)
+    )
+    return valid_rounds, missing, orphaned
 
-        function playVictory() {{
-            if (!audioCtx) audioCtx = new (window.AudioContext || window.webkitAudioContext)();
 
-            const notes = [523, 659, 784, 1047];
-            const now = audioCtx.currentTime;
+def get_valid_game_data(rows, image_folder=None):
+    """Filters the rows to include only images that actually exist."""
+    if image_folder is None:
+        image_folder = os.path.join(SCRIPT_DIR, THEMES[DEFAULT_THEME]['image_folder'])
+    return check_image_files(rows, image_folder)[0]
 
-            notes.forEach((freq, i) => {{
-                const osc = audioCtx.createOscillator();
-                const gain = audioCtx.createGain();
 
-                osc.type = 'sine';
-                osc.frequency.value = freq;
+# =============================================================================
+# CONTENT CATALOG - Process-wide cache shared by all sessions
+# =============================================================================
+class Movie:
+    """Immutable record for one playable frame, shared read-only across sessions."""
 
-                const startTime = now + i * 0.1;
-                gain.gain.setValueAtTime(0, startTime);
-                gain.gain.linearRampToValueAtTime(0.15, startTime + 0.05);
-                gain.gain.setValueAtTime(0.15, startTime + 0.3);
-                gain.gain.linearRampToValueAtTime(0, startTime + 0.6);
+    __slots__ = (
+        'filename', 'title', 'hint', 'category', 'difficulty', 'content_hash',
+        'width', 'height', 'placeholder', 'hint_text',
+    )
 
-                osc.connect(gain);
-                gain.connect(audioCtx.destination);
+    def __init__(self, filename, title, hint=None, category=None, difficulty=None, content_hash=None,
+                 width=None, height=None, placeholder=None):
+        init = object.__setattr__
+        init(self, 'filename', filename)
+        init(self, 'title', title)
+        init(self, 'hint', hint)
+        init(self, 'category', category)
+        init(self, 'difficulty', difficulty)
+        init(self, 'content_hash', content_hash)  # Image file hash, used in its URL
+        init(self, 'width', width)                # Intrinsic image size, to reserve its space
+        init(self, 'height', height)
+        init(self, 'placeholder', placeholder)    # Tiny data URI painted while the image loads
+        # Precompute the displayed hint, falling back to a first-letter clue
+        if is_missing(hint) or hint == '' or hint == '"No hint"':
+            init(self, 'hint_text', f"Starts with '{title[:1]}' • {len(title)} characters")
+        else:
+            init(self, 'hint_text', hint.strip('"'))
+
+    @classmethod
+    def from_row(cls, row, content_hash=None, width=None, height=None, placeholder=None):
+        """Build a Movie from a CSV row dict."""
+        return cls(
+            filename=row['filename'],
+            title=row.get('movie_name') or '',
+            hint=row.get('hint'),
+            category=row.get('category'),
+            difficulty=row.get('difficulty'),
+            content_hash=content_hash,
+            width=width,
+            height=height,
+            placeholder=placeholder,
+        )
 
-                osc.start(startTime);
-                osc.stop(startTime + 0.7);
-            }});
-        }}
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __repr__(self):
+        return f"Movie({self.filename!r}, {self.title!r})"
+
+
+_BIT_SELECTORS = bytes.maketrans(b'01', b'\x00\x01')  # '0'/'1' digits -> false/true selector bytes
+
+
+class ThemeCatalog:
+    """Read-only snapshot of one theme's playable content.
+
+    Built once per theme and shared by every GameState; `movies` is a tuple
+    of immutable Movie records.
+    """
+
+    def __init__(self, theme_key, movies, signature, missing=(), orphaned=()):
+        self.theme_key = theme_key
+        self.movies = tuple(movies)
+        self.by_filename = {movie.filename: movie for movie in self.movies}
+        # Bitset indexes: bit i is set when movies[i] has that category/difficulty.
+        # Bits are set in bytearrays and each index becomes an int once, so the
+        # build stays linear in the catalog size.
+        size = (len(self.movies) + 7) // 8
+        category_bytes = {}
+        difficulty_bytes = {}
+        for i, movie in enumerate(self.movies):
+            if movie.category is not None:
+                category_bytes.setdefault(movie.category, bytearray(size))[i >> 3] |= 1 << (i & 7)
+            if movie.difficulty is not None:
+                difficulty_bytes.setdefault(movie.difficulty, bytearray(size))[i >> 3] |= 1 << (i & 7)
+        self.category_bits = {key: int.from_bytes(bits, 'little') for key, bits in category_bytes.items()}
+        self.difficulty_bits = {key: int.from_bytes(bits, 'little') for key, bits in difficulty_bytes.items()}
+        self.all_bits = (1 << len(self.movies)) - 1
+        self.signature = signature  # (csv mtime, image folder mtime) at build time
+        self.missing = tuple(missing)    # CSV rows whose image file is absent
+        self.orphaned = tuple(orphaned)  # Image files no CSV row references
+
+    def __len__(self):
+        return len(self.movies)
+
+    def mask(self, category=None, difficulty=None):
+        """Bitset of movies matching a category and/or difficulty (None matches any)."""
+        bits = self.all_bits
+        if category is not None:
+            bits &= self.category_bits.get(category, 0)
+        if difficulty is not None:
+            bits &= self.difficulty_bits.get(difficulty, 0)
+        return bits
+
+    def count(self, category=None, difficulty=None):
+        """Number of matching movies (a popcount of the combined bitset)."""
+        return self.mask(category, difficulty).bit_count()
+
+    def filter(self, category=None, difficulty=None):
+        """Movies matching a category and/or difficulty (None matches any)."""
+        if category is None and difficulty is None:
+            return self.movies
+        # One linear pass: the mask's binary digits, lowest bit first, select the movies
+        selectors = bin(self.mask(category, difficulty))[:1:-1].encode().translate(_BIT_SELECTORS)
+        return tuple(itertools.compress(self.movies, selectors))
+
+    def categories(self):
+        """Distinct categories, alphabetically."""
+        return sorted(self.category_bits)
+
+    def difficulties(self):
+        """Distinct difficulties, easiest first."""
+        return sort_difficulties(self.difficulty_bits)
+
+
+class Deck:
+    """Shuffle-once deck over a catalog's filenames.
+
+    The order is fixed up front with a Fisher–Yates shuffle, so drawing is an
+    O(1) pop and `filename in deck` is an O(1) check against drawn cards.
+    Only filenames are held; `lookup(filename)` fetches the Movie when it is
+    drawn or peeked, and filenames it no longer knows are skipped.
+    """
+
+    def __init__(self, filenames, lookup, seed=None):
+        self._filenames = filenames
+        self._lookup = lookup
+        self._rng = random.Random(seed)
+        self.reset()
+
+    def reset(self):
+        """Reshuffle every movie back into the deck."""
+        self._order = list(self._filenames)
+        self._rng.shuffle(self._order)  # Fisher–Yates
+        self.drawn = set()
+
+    def draw(self):
+        """Take the next movie, or None when the deck is empty."""
+        while self._order:
+            filename = self._order.pop()
+            self.drawn.add(filename)
+            movie = self._lookup(filename)
+            if movie is not None:
+                return movie
+        return None
+
+    def peek_filename(self):
+        """Filename on top of the deck, without looking it up (None when the deck is empty)."""
+        return self._order[-1] if self._order else None
+
+    def peek(self):
+        """The movie the next draw() will return, or None when the deck is empty."""
+        for filename in reversed(self._order):
+            movie = self._lookup(filename)
+            if movie is not None:
+                return movie
+        return None
+
+    def remaining(self):
+        """Number of movies not yet drawn."""
+        return len(self._order)
+
+    def undrawn(self):
+        """Filenames still in the deck, in draw order (the last one comes next)."""
+        return list(self._order)
+
+    def restore(self, undrawn):
+        """Put the deck back into a state saved with `undrawn()`."""
+        known = set(self._filenames)
+        self._order = [filename for filename in undrawn if filename in known]
+        self.drawn = known - set(undrawn)
+
+    def __contains__(self, filename):
+        return filename in self.drawn
+
+    def __len__(self):
+        return len(self._filenames)
+
+
+DIFFICULTY_ORDER = ('Easy', 'Medium', 'Hard')
+
+FRAME_ROUTE = '/frames'  # Images served by content hash (see frame_endpoint)
+
+
+def frame_url(movie):
+    """Content-addressed URL of a movie's image (None if its hash is unknown)."""
+    if not movie.content_hash:
+        return None
+    return f'{FRAME_ROUTE}/{movie.content_hash}{os.path.splitext(movie.filename)[1].lower()}'
+
+
+_frame_paths = {}  # content hash -> image path, from every catalog build (never pruned)
 
-        function createConfetti(themeColors) {{
-            const colors = themeColors || ['{c['primary']}', '{c['accent']}', '{c['secondary']}', '{c['primary_light']}'];
 
-            for (let i = 0; i < 50; i++) {{
-                const confetti = document.createElement('div');
-                confetti.className = 'confetti';
-                confetti.style.left = Math.random() * 100 + 'vw';
-                confetti.style.background = colors[Math.floor(Math.random() * colors.length)];
-                confetti.style.animationDelay = Math.random() * 2 + 's';
-                confetti.style.animationDuration = (2 + Math.random() * 2) + 's';
-                document.body.appendChild(confetti);
+def resolve_frame(content_hash):
+    """Path of the catalog image with this content hash (None if no catalog ever had it).
 
-                setTimeout(() => confetti.remove(), 5000);
-            }}
-        }}
-    </script>
-    '''
+    Hashes stay known after a reload replaces their catalog, so games still
+    playing an older snapshot keep loading their frames.
+    """
+    path = _frame_paths.get(content_hash)
+    if path is None and CATALOG_BACKEND == 'sqlite':
+        found = get_catalog_store().frame(content_hash)  # Imported by another worker process
+        if found is not None:
+            theme_key, filename = found
+            path = os.path.join(get_theme_paths(theme_key)[1], filename)
+    return path
 
 
-def generate_body_bg(theme_colors):
-    """Generate body background CSS for theme."""
-    c = theme_colors
-    return f'''
-        background:
-            radial-gradient(ellipse at top, {c['primary']}1a 0%, transparent 50%),
-            radial-gradient(ellipse at bottom, {c['accent']}1a 0%, transparent 50%),
-            linear-gradient(180deg, {c['bg_dark']} 0%, {c['bg_mid']} 50%, {c['bg_light']} 100%);
-        min-height: 100vh;
+def sort_difficulties(values):
+    """Order difficulty labels Easy → Medium → Hard, unknown labels last."""
+    rank = {label: i for i, label in enumerate(DIFFICULTY_ORDER)}
+    return sorted(values, key=lambda value: (rank.get(value, len(rank)), value))
+
+
+_catalog_cache = {}  # theme_key -> ThemeCatalog
+_catalog_lock = threading.Lock()
+CATALOG_STATS = {'hits': 0, 'misses': 0}
+
+# Welcome-screen counts, refreshed whenever a catalog is (re)built
+_theme_counts = {}     # theme_key -> number of valid items
+_category_counts = {}  # CATEGORIES key -> total across its themes
+
+
+def get_theme_paths(theme_key):
+    """Get absolute (csv_path, image_folder) for a theme."""
+    config = THEMES[theme_key]
+    return (
+        os.path.join(SCRIPT_DIR, config['csv_file']),
+        os.path.join(SCRIPT_DIR, config['image_folder']),
+    )
+
+
+def _mtime_ns(path):
+    """Modification time of a path, or None if it doesn't exist."""
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _catalog_signature(theme_key):
+    """Cheap fingerprint used to invalidate a cached catalog."""
+    csv_path, image_folder = get_theme_paths(theme_key)
+    return (_mtime_ns(csv_path), _mtime_ns(image_folder))
+
+
+def movies_from_rows(rows, image_folder):
+    """Movie records for valid CSV rows, each carrying its image's content hash, size and placeholder."""
+    movies = []
+    for row in rows:
+        path = os.path.join(image_folder, row['filename'])
+        content_hash = file_digest(path)
+        if content_hash is not None:
+            _frame_paths[content_hash] = path
+        movies.append(Movie.from_row(row, content_hash, *image_meta(path)))
+    return movies
+
+
+def build_catalog(theme_key):
+    """Read a theme's CSV and image folder into a fresh ThemeCatalog."""
+    signature = _catalog_signature(theme_key)
+    csv_path, image_folder = get_theme_paths(theme_key)
+    rows, missing, orphaned = check_image_files(load_data(csv_path), image_folder)
+    return ThemeCatalog(theme_key, movies_from_rows(rows, image_folder), signature, missing, orphaned)
+
+
+def get_catalog(theme_key):
+    """Get the shared catalog for a theme.
+
+    A catalog whose CSV or image folder has changed is still returned; the
+    rebuild runs in the background (see schedule_reload) and later games get
+    the new one. Only a theme that was never built is built here.
+    """
+    signature = _catalog_signature(theme_key)
+    with _catalog_lock:
+        catalog = _catalog_cache.get(theme_key)
+        if catalog is not None:
+            CATALOG_STATS['hits' if catalog.signature == signature else 'misses'] += 1
+    if catalog is not None:
+        if catalog.signature != signature:
+            schedule_reload(theme_key)
+        return catalog
+    catalog = build_catalog(theme_key)  # Cold miss: outside the lock, so other themes aren't held up
+    with _catalog_lock:
+        CATALOG_STATS['misses'] += 1
+        if theme_key not in _catalog_cache:
+            _catalog_cache[theme_key] = catalog
+            _update_counts(theme_key, len(catalog))
+        return _catalog_cache[theme_key]
+
+
+def _update_counts(theme_key, count):
+    """Record a theme's item count and recompute category totals (caller holds the lock)."""
+    _theme_counts[theme_key] = count
+    for cat_key, cat in CATEGORIES.items():
+        if cat['subcategories'] is None:
+            theme_keys = THEMES.keys()  # YOLO: all themes
+        else:
+            theme_keys = [sub['theme_key'] for sub in cat['subcategories'].values()]
+        _category_counts[cat_key] = sum(_theme_counts.get(tk, 0) for tk in theme_keys)
+
+
+def warm_catalogs():
+    """Build every theme's catalog (and the welcome-screen counts) up front."""
+    for theme_key in THEMES:
+        if CATALOG_BACKEND == 'sqlite':
+            get_catalog_store().sync(theme_key)
+        else:
+            get_catalog(theme_key)
+
+
+def get_theme_item_count(theme_key):
+    """Number of valid items for a theme, without touching the disk once warmed."""
+    if theme_key not in _theme_counts:
+        warm_catalogs()
+    return _theme_counts[theme_key]
+
+
+def get_category_item_count(cat_key):
+    """Total item count across all subcategories in a category (YOLO: all themes)."""
+    if len(_theme_counts) < len(THEMES):
+        warm_catalogs()
+    return _category_counts[cat_key]
+
+
+def get_catalog_stats():
+    """Snapshot of catalog cache counters (for the /stats endpoint)."""
+    with _catalog_lock:
+        return {
+            **CATALOG_STATS,
+            'themes': {
+                key: {'items': len(cat), 'missing': list(cat.missing), 'orphaned': list(cat.orphaned)}
+                for key, cat in _catalog_cache.items()
+            },
+        }
+
+
+# =============================================================================
+# SQLITE CATALOG STORE - Optional indexed backend (CATALOG_BACKEND=sqlite)
+# =============================================================================
+class CatalogStore:
+    """SQLite copy of the theme CSVs with indexes on theme, category and difficulty.
+
+    Decks are built with indexed queries, so workers only hold the rows a
+    session actually plays instead of every theme's full catalog.
+    """
+
+    SCHEMA = '''
+        CREATE TABLE IF NOT EXISTS frames (
+            theme TEXT NOT NULL,
+            filename TEXT NOT NULL,
+            title TEXT NOT NULL,
+            hint TEXT,
+            category TEXT,
+            difficulty TEXT,
+            content_hash TEXT,
+            width INTEGER,
+            height INTEGER,
+            placeholder TEXT,
+            PRIMARY KEY (theme, filename)
+        );
+        CREATE INDEX IF NOT EXISTS idx_frames_category ON frames (theme, category, difficulty);
+        CREATE INDEX IF NOT EXISTS idx_frames_difficulty ON frames (theme, difficulty);
+        CREATE INDEX IF NOT EXISTS idx_frames_hash ON frames (content_hash);
+        CREATE TABLE IF NOT EXISTS themes (
+            theme TEXT PRIMARY KEY,
+            csv_mtime INTEGER,
+            folder_mtime INTEGER
+        );
     '''
 
+    SCHEMA_VERSION = 3  # Bump when SCHEMA changes; the tables are rebuilt from the CSVs
+
+    def __init__(self, path):
+        self.path = path
+        self._local = threading.local()  # One connection per thread
+        self._write_lock = threading.Lock()
+        with self._connect() as conn:
+            conn.execute('PRAGMA journal_mode=WAL')
+            if conn.execute('PRAGMA user_version').fetchone()[0] != self.SCHEMA_VERSION:
+                conn.executescript('DROP TABLE IF EXISTS frames; DROP TABLE IF EXISTS themes;')
+            conn.executescript(self.SCHEMA)
+            conn.execute(f'PRAGMA user_version = {self.SCHEMA_VERSION}')
+
+    def _connect(self):
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path)
+            self._local.conn = conn
+        return conn
+
+    def signature(self, theme_key):
+        """(csv mtime, image folder mtime) the stored rows were built from."""
+        row = self._connect().execute(
+            'SELECT csv_mtime, folder_mtime FROM themes WHERE theme = ?', (theme_key,)
+        ).fetchone()
+        return tuple(row) if row else None
+
+    def sync(self, theme_key, force=False):
+        """Re-import a theme's CSV if it changed on disk; returns its row count."""
+        signature = _catalog_signature(theme_key)
+        if force or self.signature(theme_key) != signature:
+            csv_path, image_folder = get_theme_paths(theme_key)
+            rows = check_image_files(load_data(csv_path), image_folder)[0]
+            movies = movies_from_rows(rows, image_folder)
+            with self._write_lock, self._connect() as conn:
+                conn.execute('DELETE FROM frames WHERE theme = ?', (theme_key,))
+                conn.executemany(
+                    'INSERT OR REPLACE INTO frames VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                    [(theme_key, m.filename, m.title, m.hint, m.category, m.difficulty, m.content_hash,
+                      m.width, m.height, m.placeholder)
+                     for m in movies],
+                )
+                conn.execute('INSERT OR REPLACE INTO themes VALUES (?, ?, ?)', (theme_key, *signature))
+        count = self.count(theme_key)
+        with _catalog_lock:
+            _update_counts(theme_key, count)
+        return count
+
+    @staticmethod
+    def _where(theme_key, category, difficulty):
+        clauses, params = ['theme = ?'], [theme_key]
+        if category is not None:
+            clauses.append('category = ?')
+            params.append(category)
+        if difficulty is not None:
+            clauses.append('difficulty = ?')
+            params.append(difficulty)
+        return ' AND '.join(clauses), params
+
+    MOVIE_COLUMNS = 'filename, title, hint, category, difficulty, content_hash, width, height, placeholder'
+
+    def movies(self, theme_key, category=None, difficulty=None):
+        """Movies for a theme, optionally filtered, via an indexed query."""
+        where, params = self._where(theme_key, category, difficulty)
+        rows = self._connect().execute(
+            f'SELECT {self.MOVIE_COLUMNS} FROM frames WHERE {where} ORDER BY rowid',
+            params,
+        )
+        return tuple(Movie(*row) for row in rows)
+
+    def filenames(self, theme_key, category=None, difficulty=None):
+        """Filenames of a theme's movies, optionally filtered, via an indexed query."""
+        where, params = self._where(theme_key, category, difficulty)
+        rows = self._connect().execute(f'SELECT filename FROM frames WHERE {where} ORDER BY rowid', params)
+        return [row[0] for row in rows]
+
+    def movie(self, theme_key, filename):
+        """Look up a single movie by filename (or None)."""
+        row = self._connect().execute(
+            f'SELECT {self.MOVIE_COLUMNS} FROM frames WHERE theme = ? AND filename = ?',
+            (theme_key, filename),
+        ).fetchone()
+        return Movie(*row) if row else None
+
+    def frame(self, content_hash):
+        """(theme, filename) of the image with this content hash (or None)."""
+        row = self._connect().execute(
+            'SELECT theme, filename FROM frames WHERE content_hash = ? LIMIT 1', (content_hash,)
+        ).fetchone()
+        return tuple(row) if row else None
+
+    def count(self, theme_key, category=None, difficulty=None):
+        """Number of movies matching the filters."""
+        where, params = self._where(theme_key, category, difficulty)
+        return self._connect().execute(f'SELECT COUNT(*) FROM frames WHERE {where}', params).fetchone()[0]
+
+    def categories(self, theme_key):
+        """Distinct categories for a theme, alphabetically."""
+        rows = self._connect().execute(
+            'SELECT DISTINCT category FROM frames WHERE theme = ? AND category IS NOT NULL ORDER BY category',
+            (theme_key,),
+        )
+        return [row[0] for row in rows]
+
+    def difficulties(self, theme_key):
+        """Distinct difficulties for a theme, easiest first."""
+        rows = self._connect().execute(
+            'SELECT DISTINCT difficulty FROM frames WHERE theme = ? AND difficulty IS NOT NULL',
+            (theme_key,),
+        )
+        return sort_difficulties(row[0] for row in rows)
+
+
+_catalog_store = None
+
+
+def get_catalog_store():
+    """Process-wide SQLite store, opened on first use."""
+    global _catalog_store
+    if _catalog_store is None:
+        _catalog_store = CatalogStore(CATALOG_DB)
+    return _catalog_store
+
+
+def get_synced_store(theme_key):
+    """The SQLite store, with `theme_key` imported and a background re-import queued if it's stale."""
+    store = get_catalog_store()
+    stored = store.signature(theme_key)
+    if stored is None:
+        store.sync(theme_key)  # Never imported: nothing to serve until it is
+    elif stored != _catalog_signature(theme_key):
+        schedule_reload(theme_key)
+    return store
+
+
 # =============================================================================
-# DATA LOADING
+# CATALOG HOT RELOAD - Rebuild themes in the background when content changes
 # =============================================================================
-def load_data(csv_file=None):
-    """Loads the CSV and ensures we only use rows where images exist."""
-    if csv_file is None:
-        csv_file = os.path.join(SCRIPT_DIR, THEMES[DEFAULT_THEME]['csv_file'])
-    if not os.path.exists(csv_file):
-        return pd.DataFrame()
-    df = pd.read_csv(csv_file)
-    df.columns = [c.strip().lower() for c in df.columns]
-    return df
+RELOAD_STATS = {'reloads': 0, 'last_reload_ms': None, 'max_reload_ms': 0.0, 'watcher': None}
+
+
+def reload_catalog(theme_key):
+    """Rebuild a theme's catalog and atomically swap it in for new games.
+
+    Sessions already playing keep the catalog object they were given.
+    """
+    started = time.perf_counter()
+    if CATALOG_BACKEND == 'sqlite':
+        catalog = None
+        get_catalog_store().sync(theme_key, force=True)
+    else:
+        catalog = build_catalog(theme_key)
+    elapsed_ms = round((time.perf_counter() - started) * 1000, 2)
+    with _catalog_lock:
+        if catalog is not None:
+            _catalog_cache[theme_key] = catalog
+            _update_counts(theme_key, len(catalog))
+        RELOAD_STATS['reloads'] += 1
+        RELOAD_STATS['last_reload_ms'] = elapsed_ms
+        RELOAD_STATS['max_reload_ms'] = max(RELOAD_STATS['max_reload_ms'], elapsed_ms)
+    return catalog
+
+
+_reloads_pending = set()  # Themes with a background reload queued or running
+
+
+def schedule_reload(theme_key):
+    """Rebuild a theme with reload_catalog() in a worker thread, unless one is already on its way.
+
+    Does nothing outside the event loop (e.g. when called from a worker
+    thread); the watcher or the next page load picks the change up.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return
+    if theme_key in _reloads_pending:
+        return
+    _reloads_pending.add(theme_key)
+    background_tasks.create(_reload_in_background(theme_key), name=f'reload catalog {theme_key}')
+
+
+async def _reload_in_background(theme_key):
+    try:
+        await run.io_bound(reload_catalog, theme_key)
+    finally:
+        _reloads_pending.discard(theme_key)
+
+
+def _stale_themes():
+    """Themes whose cached catalog no longer matches the files on disk."""
+    if CATALOG_BACKEND == 'sqlite':
+        store = get_catalog_store()
+        cached = {key: store.signature(key) for key in THEMES}
+    else:
+        with _catalog_lock:
+            cached = {key: cat.signature for key, cat in _catalog_cache.items()}
+    return [key for key in THEMES if cached.get(key) != _catalog_signature(key)]
+
+
+async def watch_catalogs():
+    """Background task: reload a theme when its CSV or image folder changes.
+
+    Uses watchfiles (inotify/FSEvents) when available, else polls mtimes.
+    """
+    try:
+        from watchfiles import DefaultFilter, awatch
+    except ImportError:
+        awatch = None
+
+    watched = [SCRIPT_DIR] + [get_theme_paths(key)[1] for key in THEMES]
+    watched = [path for path in watched if os.path.isdir(path)]
+
+    if awatch is not None:
+        RELOAD_STATS['watcher'] = 'watchfiles'
+        # The SQLite catalog (and its -wal/-shm files) sits next to the CSVs; its writes aren't content changes
+        watch_filter = DefaultFilter(ignore_paths=(os.path.abspath(CATALOG_DB),))
+        async for _changes in awatch(*watched, recursive=False, watch_filter=watch_filter):
+            # Signatures decide which themes actually changed
+            for theme_key in await run.io_bound(_stale_themes):
+                schedule_reload(theme_key)
+    else:
+        RELOAD_STATS['watcher'] = 'polling'
+        while True:
+            await asyncio.sleep(CATALOG_POLL_SEC)
+            for theme_key in await run.io_bound(_stale_themes):
+                schedule_reload(theme_key)
 
 
-def get_valid_game_data(df, image_folder=None):
-    """Filters the dataframe to include only images that actually exist."""
-    if image_folder is None:
-        image_folder = os.path.join(SCRIPT_DIR, THEMES[DEFAULT_THEME]['image_folder'])
-    if df.empty:
-        return []
-    valid_rounds = []
-    for _, row in df.iterrows():
-        image_path = os.path.join(image_folder, row['filename'])
-        if os.path.exists(image_path):
-            valid_rounds.append(row.to_dict())
-    return valid_rounds
+# =============================================================================
+# IMAGE VARIANTS - Width-bucketed, re-encoded frames in an LRU disk cache
+# =============================================================================
+try:
+    from PIL import Image, ImageFilter
+    Image.init()
+except ImportError:
+    Image = ImageFilter = None
+
+# Output formats, best first: (format, media type, Pillow save options)
+VARIANT_FORMATS = (
+    ('avif', 'image/avif', {'quality': 55}),
+    ('webp', 'image/webp', {'quality': 80, 'method': 4}),
+    ('jpeg', 'image/jpeg', {'quality': 82, 'optimize': True, 'progressive': True}),
+)
+# Displayed at most 896px wide (max-w-4xl card) and full width below that
+IMAGE_SIZES = '(max-width: 896px) 100vw, 896px'
+VARIANT_STATS = {'hits': 0, 'misses': 0, 'generated': 0, 'failed': 0, 'evictions': 0, 'bytes': 0}
+
+
+def variants_enabled():
+    """True when Pillow is installed and can write at least one variant format."""
+    return Image is not None and any(fmt.upper() in Image.SAVE for fmt, _, _ in VARIANT_FORMATS)
+
+
+def variant_width(requested):
+    """Smallest width bucket that covers the requested width."""
+    for width in IMAGE_VARIANT_WIDTHS:
+        if requested <= width:
+            return width
+    return IMAGE_VARIANT_WIDTHS[-1]
+
+
+def negotiate_variant_format(accept):
+    """(format, media type, save options) for the best format the client accepts and Pillow can write."""
+    accept = accept.lower()
+    for fmt, media_type, options in VARIANT_FORMATS:
+        if fmt.upper() in Image.SAVE and (fmt == 'jpeg' or media_type in accept):
+            return fmt, media_type, options
+    return VARIANT_FORMATS[-1]
+
+
+def render_variant(source_path, width, blur_radius, fmt, options):
+    """Resize (never upscale), optionally blur, and encode one frame; runs in the variant worker pool."""
+    with Image.open(source_path) as image:
+        image.load()
+        if image.width > width:
+            image = image.resize((width, max(1, round(image.height * width / image.width))), Image.Resampling.LANCZOS)
+        if fmt == 'jpeg' and image.mode not in ('RGB', 'L'):
+            image = image.convert('RGB')
+        if blur_radius:
+            image = image.filter(ImageFilter.GaussianBlur(blur_radius))
+        buffer = io.BytesIO()
+        image.save(buffer, format=fmt.upper(), **options)
+        return buffer.getvalue()
+
+
+class VariantCache:
+    """Size-bounded LRU cache of encoded variants, kept as files in one directory.
+
+    Recency survives restarts through file mtimes; the least recently used
+    files are deleted once the total size goes over `max_bytes`.
+    """
+
+    def __init__(self, directory, max_bytes):
+        """Open (creating) the cache directory and index what is in it; blocking, so run in the worker pool."""
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()  # name -> size, least recently used first
+        self.total_bytes = 0
+        os.makedirs(directory, exist_ok=True)
+        with os.scandir(directory) as entries:
+            files = sorted((e.stat().st_mtime_ns, e.name, e.stat().st_size) for e in entries if e.is_file())
+        for _, name, size in files:
+            if name.endswith('.tmp'):
+                os.remove(os.path.join(directory, name))  # Left by an interrupted write
+                continue
+            self._entries[name] = size
+            self.total_bytes += size
+
+    def read(self, name):
+        """Bytes of a cached variant, marking it recently used, or None (worker pool).
+
+        A file that went away since it was indexed (evicted by a concurrent
+        put, or deleted by hand) is dropped and counts as a miss.
+        """
+        with self._lock:
+            if name not in self._entries:
+                return None
+            self._entries.move_to_end(name)
+        path = os.path.join(self.directory, name)
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+        except OSError:
+            with self._lock:
+                self.total_bytes -= self._entries.pop(name, 0)
+                VARIANT_STATS['bytes'] = self.total_bytes
+            return None
+        try:
+            os.utime(path)  # Recency across restarts
+        except OSError:
+            pass
+        return data
+
+    def put(self, name, data):
+        """Store a variant atomically and evict the least recently used ones (worker pool); returns its path."""
+        path = os.path.join(self.directory, name)
+        tmp_path = f'{path}.{threading.get_ident()}.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+        with self._lock:
+            self.total_bytes += len(data) - self._entries.pop(name, 0)
+            self._entries[name] = len(data)
+            while self.total_bytes > self.max_bytes and len(self._entries) > 1:
+                old_name, old_size = self._entries.popitem(last=False)
+                self.total_bytes -= old_size
+                VARIANT_STATS['evictions'] += 1
+                try:
+                    os.remove(os.path.join(self.directory, old_name))
+                except OSError:
+                    pass
+            VARIANT_STATS['bytes'] = self.total_bytes
+        return path
+
+
+_variant_cache = None
+_variant_pool = None
+_variant_jobs = {}  # name -> asyncio.Future of a variant being generated, resolving to its bytes
+_failed_variants = set()  # Variant names whose source Pillow couldn't render; not retried
+
+
+def _open_variant_cache():
+    cache = VariantCache(IMAGE_CACHE_DIR, int(IMAGE_CACHE_MAX_MB * 1024 * 1024))
+    VARIANT_STATS['bytes'] = cache.total_bytes
+    return cache
+
+
+async def get_variant_cache():
+    """Process-wide variant cache, opened in the worker pool at startup or on first use."""
+    global _variant_cache
+    if _variant_cache is None:  # Concurrent first requests share one open
+        _variant_cache = asyncio.get_running_loop().run_in_executor(get_variant_pool(), _open_variant_cache)
+    return await _variant_cache
+
+
+async def open_variant_cache():
+    """Index the variant cache directory at startup, off the event loop."""
+    if not variants_enabled():
+        return
+    try:
+        await get_variant_cache()
+    except OSError:
+        logging.getLogger(__name__).exception('Could not open the image variant cache in %s', IMAGE_CACHE_DIR)
+
+
+def variant_spec(content_hash, accept, requested_width=0, tier=None):
+    """(name, media type, width, blur radius, format, save options) of the variant a request asks for.
+
+    A `tier` (index into REVEAL_TIERS) selects a blurred reveal tier instead
+    of a width bucket.
+    """
+    fmt, media_type, options = negotiate_variant_format(accept)
+    if tier is None:
+        width, blur_radius = variant_width(requested_width), 0
+        name = f'{content_hash}-{width}.{fmt}'
+    else:
+        width, blur_radius = REVEAL_TIERS[tier]
+        name = f'{content_hash}-t{tier}.{fmt}'
+    return name, media_type, width, blur_radius, fmt, options
+
+
+def get_variant_pool():
+    """Worker pool for variant encoding and cache file I/O, started on first use."""
+    global _variant_pool
+    if _variant_pool is None:
+        _variant_pool = ThreadPoolExecutor(max_workers=IMAGE_WORKERS, thread_name_prefix='image-variant')
+    return _variant_pool
+
+
+def build_variant(cache, name, source_path, width, blur_radius, fmt, options):
+    """Worker-pool job: render a variant and store it in the cache; returns its bytes."""
+    data = render_variant(source_path, width, blur_radius, fmt, options)
+    cache.put(name, data)
+    return data
+
+
+def _variant_job_done(name, job):
+    _variant_jobs.pop(name, None)
+    if job.cancelled():
+        return
+    if job.exception() is None:
+        VARIANT_STATS['generated'] += 1
+    else:
+        _failed_variants.add(name)
+        VARIANT_STATS['failed'] += 1
+        logging.getLogger(__name__).warning('Could not render image variant %s: %s', name, job.exception())
+
+
+async def get_variant(source_path, spec):
+    """Bytes of a frame variant (see variant_spec), generating it in the worker pool on first request.
+
+    Cache files are read in the worker pool too, so one evicted in the
+    meantime is simply regenerated. Returns None when the source can't be
+    rendered (e.g. a format this Pillow can't decode, or a corrupt file);
+    that is remembered.
+    """
+    name, _, width, blur_radius, fmt, options = spec
+    if name in _failed_variants:
+        return None
+    loop = asyncio.get_running_loop()
+    try:
+        cache = await get_variant_cache()
+    except OSError:
+        return None  # Cache directory unusable; logged by open_variant_cache
+    data = await loop.run_in_executor(get_variant_pool(), cache.read, name)
+    if data is not None:
+        VARIANT_STATS['hits'] += 1
+        return data
+    VARIANT_STATS['misses'] += 1
+    job = _variant_jobs.get(name)
+    if job is None:  # Concurrent requests for the same variant share one job and its result
+        job = loop.run_in_executor(
+            get_variant_pool(), build_variant, cache, name, source_path, width, blur_radius, fmt, options
+        )
+        _variant_jobs[name] = job
+        job.add_done_callback(lambda done: _variant_job_done(name, done))
+    try:
+        return await job
+    except Exception:
+        return None  # Logged and remembered by _variant_job_done
+
+
+PLACEHOLDER_WIDTH = 16  # Catalog placeholders: a thumbnail this wide, inlined as a data URI
+
+
+def frame_placeholder(path):
+    """Data URI of a tiny thumbnail of a frame, or None without Pillow."""
+    if not variants_enabled():
+        return None
+    fmt, media_type = ('webp', 'image/webp') if 'WEBP' in Image.SAVE else ('jpeg', 'image/jpeg')
+    try:
+        data = render_variant(path, PLACEHOLDER_WIDTH, 0, fmt, {'quality': 40})
+    except OSError:
+        return None
+    return f'data:{media_type};base64,{base64.b64encode(data).decode()}'
+
+
+def frame_srcset(movie):
+    """srcset of width-bucketed variants for a movie's image ('' when variants are unavailable)."""
+    base = frame_url(movie)
+    if base is None or not variants_enabled():
+        return ''
+    return ', '.join(f'{base}?w={width} {width}w' for width in IMAGE_VARIANT_WIDTHS)
+
+
+def frame_tier_url(movie, tier):
+    """URL of one of a movie's pre-blurred reveal tiers (None when tiers are unavailable)."""
+    base = frame_url(movie)
+    if base is None or not variants_enabled():
+        return None
+    return f'{base}?tier={tier}'
+
+
+# =============================================================================
+# FRAME CACHE - Encoded image bytes for hot frames, kept in memory
+# =============================================================================
+FRAME_CACHE_STATS = {'hits': 0, 'misses': 0, 'evictions': 0, 'bytes': 0, 'items': 0}
+
+
+class FrameCache:
+    """Size-bounded LRU of (bytes, media type) keyed by what /frames serves.
+
+    Keys are content-addressed (a frame's hash or a variant name), so an
+    entry never goes stale; it only drops out when space is needed. Items
+    larger than a quarter of the budget are not kept, so one big image
+    can't flush everything else.
+    """
+
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()  # key -> (data, media_type), least recently used first
+        self.total_bytes = 0
+
+    def get(self, key):
+        """(data, media type) for a key, marking it recently used; None on a miss."""
+        entry = self._entries.get(key)
+        if entry is None:
+            FRAME_CACHE_STATS['misses'] += 1
+            return None
+        self._entries.move_to_end(key)
+        FRAME_CACHE_STATS['hits'] += 1
+        return entry
+
+    def accepts(self, size):
+        """Whether an item of `size` bytes would be kept."""
+        return size <= self.max_bytes // 4
+
+    def put(self, key, data, media_type):
+        """Keep a frame's bytes, evicting the least recently used ones to stay under the limit."""
+        if not self.accepts(len(data)):
+            return
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self.total_bytes -= len(old[0])
+        self._entries[key] = (data, media_type)
+        self.total_bytes += len(data)
+        while self.total_bytes > self.max_bytes:
+            _, (old_data, _) = self._entries.popitem(last=False)
+            self.total_bytes -= len(old_data)
+            FRAME_CACHE_STATS['evictions'] += 1
+        FRAME_CACHE_STATS['bytes'] = self.total_bytes
+        FRAME_CACHE_STATS['items'] = len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+
+frame_cache = FrameCache(int(FRAME_CACHE_MB * 1024 * 1024)) if FRAME_CACHE_MB > 0 else None
+
+
+def read_frame(path):
+    """(bytes, media type) of an image file."""
+    with open(path, 'rb') as f:
+        return f.read(), mimetypes.guess_type(path)[0] or 'application/octet-stream'
+
+
+async def warm_frame_cache():
+    """Preload the default theme's frames into the byte cache (FRAME_CACHE_WARM)."""
+    if frame_cache is None or not FRAME_CACHE_WARM:
+        return
+    if CATALOG_BACKEND == 'sqlite':
+        movies = get_catalog_store().movies(DEFAULT_THEME)
+    else:
+        movies = get_catalog(DEFAULT_THEME).movies
+    image_folder = get_theme_paths(DEFAULT_THEME)[1]
+    budget = frame_cache.max_bytes
+    for movie in movies:
+        if movie.content_hash is None or movie.content_hash in frame_cache:
+            continue
+        path = os.path.join(image_folder, movie.filename)
+        try:
+            size = os.path.getsize(path)
+        except OSError:
+            continue
+        if size > budget:
+            break  # Full: leave the rest to be cached as they are requested
+        if not frame_cache.accepts(size):
+            continue
+        data, media_type = await run.io_bound(read_frame, path)
+        frame_cache.put(movie.content_hash, data, media_type)
+        budget -= len(data)
+
+
+# =============================================================================
+# ROUND CLOCK METRICS
+# =============================================================================
+CLOCK_STATS = {'timeouts': 0, 'last_lateness_ms': None, 'max_lateness_ms': 0.0, 'mean_lateness_ms': None}
+
+
+def record_clock_lateness(lateness_sec):
+    """Record how late a round timeout fired relative to its monotonic deadline."""
+    lateness_ms = round(max(0.0, lateness_sec) * 1000, 2)
+    count = CLOCK_STATS['timeouts'] + 1
+    previous_mean = CLOCK_STATS['mean_lateness_ms'] or 0.0
+    CLOCK_STATS['timeouts'] = count
+    CLOCK_STATS['last_lateness_ms'] = lateness_ms
+    CLOCK_STATS['max_lateness_ms'] = max(CLOCK_STATS['max_lateness_ms'], lateness_ms)
+    CLOCK_STATS['mean_lateness_ms'] = round(previous_mean + (lateness_ms - previous_mean) / count, 2)
+
+
+# =============================================================================
+# RENDER METRICS
+# =============================================================================
+RENDER_STATS = {
+    'screen_builds': 0, 'round_updates': 0,
+    'last_build_elements': None, 'last_update_elements': None, 'elements_created': 0,
+}
+
+
+def record_render(kind, elements_created):
+    """Count a game screen build or in-place round update and the elements it created."""
+    RENDER_STATS[kind] += 1
+    RENDER_STATS['last_build_elements' if kind == 'screen_builds' else 'last_update_elements'] = elements_created
+    RENDER_STATS['elements_created'] += elements_created
+
+
+# =============================================================================
+# ROUND SCHEDULER - One process-wide deadline heap for every session
+# =============================================================================
+class DeadlineScheduler:
+    """Runs callbacks at monotonic deadlines from a single asyncio task.
+
+    Only sessions with a running round have an entry, and the task sleeps
+    until the earliest deadline, so idle clients cost nothing and the work
+    done is proportional to the transitions that are actually due.
+    """
+
+    def __init__(self):
+        self._heap = []     # (deadline, seq, key); stale entries are skipped lazily
+        self._entries = {}  # key -> (deadline, seq, callback)
+        self._seq = itertools.count()
+        self._wakeup = None  # asyncio.Event, created inside the running loop
+        self.fired = 0
+
+    def schedule(self, key, deadline, callback):
+        """Run `callback` at `deadline` (time.monotonic()), replacing any entry for `key`."""
+        seq = next(self._seq)
+        self._entries[key] = (deadline, seq, callback)
+        heapq.heappush(self._heap, (deadline, seq, key))
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    def cancel(self, key):
+        """Drop the pending entry for `key`, if any."""
+        self._entries.pop(key, None)
+
+    def pending(self):
+        """Number of sessions waiting on a deadline."""
+        return len(self._entries)
+
+    def _pop_stale(self):
+        while self._heap:
+            _, seq, key = self._heap[0]
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] == seq:
+                return
+            heapq.heappop(self._heap)
+
+    async def run(self):
+        """Scheduler loop; started once from app.on_startup."""
+        self._wakeup = asyncio.Event()
+        while True:
+            self._pop_stale()
+            if not self._heap:
+                await self._wakeup.wait()
+                self._wakeup.clear()
+                continue
+            delay = self._heap[0][0] - time.monotonic()
+            if delay > 0:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), delay)
+                except asyncio.TimeoutError:
+                    pass
+                self._wakeup.clear()
+                continue
+            _, _, key = heapq.heappop(self._heap)
+            _, _, callback = self._entries.pop(key)
+            self.fired += 1
+            try:
+                callback()
+            except Exception:
+                logging.getLogger(__name__).exception('Round deadline callback failed')
+
+
+round_scheduler = DeadlineScheduler()
+
+
+# =============================================================================
+# SUSPENDED GAMES - Idle background tabs park their state here and disconnect
+# =============================================================================
+_suspended_games = OrderedDict()  # token -> GameState.to_dict(), oldest first
+SUSPEND_STATS = {'hidden': 0, 'suspended': 0, 'resumed': 0, 'dropped': 0}
+
+
+def park_game(state):
+    """Keep a serialized game until its tab comes back; returns the resume token."""
+    token = secrets.token_urlsafe(16)
+    _suspended_games[token] = state
+    SUSPEND_STATS['suspended'] += 1
+    while len(_suspended_games) > SUSPENDED_GAMES_MAX:
+        _suspended_games.popitem(last=False)
+        SUSPEND_STATS['dropped'] += 1
+    return token
+
+
+def unpark_game(token):
+    """Take a parked game back out (None if the token is unknown or was dropped)."""
+    state = _suspended_games.pop(token, None) if token else None
+    if state is not None:
+        SUSPEND_STATS['resumed'] += 1
+    return state
 
 
 # =============================================================================
@@ -1227,18 +2757,34 @@ def get_valid_game_data(df, image_folder=None):
 class GameState:
     """Manages the game logic and state."""
 
-    def __init__(self):
+    # Plain attributes carried over when an idle game is parked (see to_dict)
+    PARKED_FIELDS = (
+        'round_duration', 'show_hint', 'show_answer', 'game_over', 'score', 'current_screen',
+        'team_mode', 'timer_duration', 'team_names', 'team_scores', 'current_team', 'hint_used',
+        'awaiting_score', 'progressive_reveal', 'timer_paused', 'image_revealed',
+        'selected_category', 'selected_subcategory', 'welcome_step',
+    )
+
+    def __init__(self, seed=None):
         # Theme support
         self.theme = DEFAULT_THEME
+        self.deck_seed = seed  # Optional seed for a reproducible shuffle
+        self.category_filter = None    # Deck filters (None = any)
+        self.difficulty_filter = None
         self._load_theme_data()
 
         self.shown_movies = []
+        self.shown_positions = {}  # filename -> index in shown_movies
         self.current_movie = None
-        self.time_left = GAME_DURATION_SEC
         self.show_hint = False
         self.show_answer = False
         self.game_over = False
         self.timer_active = False
+        # Round clock (time.monotonic() timestamps; paused intervals don't count)
+        self.round_duration = GAME_DURATION_SEC
+        self.round_started_at = None  # Set when the image loads and the clock first runs
+        self.paused_total = 0.0       # Seconds spent stopped since the round started
+        self.paused_at = None         # When the clock was last stopped (None while running)
         self.score = 0  # Track successful guesses (solo mode)
         self.current_screen = 'welcome'  # welcome, game, gameover
 
@@ -1256,7 +2802,6 @@ class GameState:
 
         # Feature 1: History navigation (review mode)
         self.reviewing_movie = None  # Movie being reviewed (or None)
-        self.saved_time_left = None  # Saved timer when entering review
         self.saved_timer_active = False  # Saved timer state
 
         # Feature 2: Timer pause
@@ -1270,13 +2815,84 @@ class GameState:
         self.selected_subcategory = None   # 'bollywood', 'hollywood', 'american'
         self.welcome_step = 1              # 1=category, 2=subcategory, 3=config
 
+    def to_dict(self):
+        """Serialize the game to plain data (review mode and the running clock are not kept)."""
+        state = {name: getattr(self, name) for name in self.PARKED_FIELDS}
+        state.update(
+            theme=self.theme,
+            deck_seed=self.deck_seed,
+            category_filter=self.category_filter,
+            difficulty_filter=self.difficulty_filter,
+            undrawn=self.deck.undrawn(),
+            shown_movies=list(self.shown_movies),
+            current_movie=self.current_movie.filename if self.current_movie else None,
+            time_left=self.remaining() if self.round_started_at is not None else None,
+        )
+        return state
+
+    @classmethod
+    def from_dict(cls, state):
+        """Rebuild a game saved with to_dict(); the round comes back with its clock stopped."""
+        game = cls(seed=state['deck_seed'])
+        game.theme = state['theme'] if state['theme'] in THEMES else DEFAULT_THEME
+        game.category_filter = state['category_filter']
+        game.difficulty_filter = state['difficulty_filter']
+        game._load_theme_data()
+        for name in cls.PARKED_FIELDS:
+            value = state[name]
+            setattr(game, name, list(value) if isinstance(value, list) else value)
+        game.deck.restore(state['undrawn'])
+        game.shown_movies = list(state['shown_movies'])
+        game.shown_positions = {filename: i for i, filename in enumerate(game.shown_movies)}
+        if state['current_movie']:
+            game.current_movie = game.find_movie(state['current_movie'])
+        if state['time_left'] is not None:
+            now = time.monotonic()
+            game.round_started_at = now - (game.round_duration - state['time_left'])
+            game.paused_at = now
+        if game.current_screen == 'game' and game.current_movie is None and not game.game_over:
+            game.next_movie()  # The movie was removed from the catalog while parked
+        return game
+
     def _load_theme_data(self):
-        """Load data for current theme."""
-        config = self.get_theme_config()
-        csv_path = os.path.join(SCRIPT_DIR, config['csv_file'])
-        image_folder = os.path.join(SCRIPT_DIR, config['image_folder'])
-        self.df = load_data(csv_path)
-        self.valid_movies = get_valid_game_data(self.df, image_folder)
+        """Load (filtered) data for current theme from the shared catalog or SQLite store."""
+        if CATALOG_BACKEND == 'sqlite':
+            # Only filenames are kept per session; movies are fetched as they are drawn
+            self.catalog = None
+            filenames = get_synced_store(self.theme).filenames(
+                self.theme, self.category_filter, self.difficulty_filter
+            )
+        else:
+            self.catalog = get_catalog(self.theme)
+            filenames = [movie.filename for movie in self.catalog.filter(self.category_filter, self.difficulty_filter)]
+        self.deck = Deck(filenames, self.find_movie, self.deck_seed)
+
+    def find_movie(self, filename):
+        """Look up a movie of the current theme by filename."""
+        if self.catalog is not None:
+            return self.catalog.by_filename.get(filename)
+        return get_catalog_store().movie(self.theme, filename)
+
+    def get_filter_options(self):
+        """(categories, difficulties) available for the current theme."""
+        if self.catalog is not None:
+            return self.catalog.categories(), self.catalog.difficulties()
+        store = get_catalog_store()
+        return store.categories(self.theme), store.difficulties(self.theme)
+
+    def count_matching(self, category=None, difficulty=None):
+        """Number of movies a deck with these filters would hold."""
+        if self.catalog is not None:
+            return self.catalog.count(category, difficulty)
+        return get_catalog_store().count(self.theme, category, difficulty)
+
+    def set_filters(self, category=None, difficulty=None):
+        """Restrict the deck to a category and/or difficulty (None = any)."""
+        self.category_filter = category
+        self.difficulty_filter = difficulty
+        self._load_theme_data()
+        self.shown_movies = []
+        self.shown_positions = {}
 
     def select_category(self, category_key):
         """Select a category and determine next step."""
@@ -1320,24 +2936,38 @@ class GameState:
         """Switch to a different theme."""
         if theme_name in THEMES:
             self.theme = theme_name
+            self.category_filter = None  # Categories differ between themes
             self._load_theme_data()
             self.randomize_team_names()
             # Reset shown movies when switching themes
             self.shown_movies = []
+            self.shown_positions = {}
 
     def get_image_folder(self):
         """Get the image folder path for current theme."""
         return os.path.join(SCRIPT_DIR, self.get_theme_config()['image_folder'])
 
+    def get_image_source(self, movie):
+        """Image source for a movie: its content-hashed URL, or the file path if unhashed."""
+        return frame_url(movie) or os.path.join(self.get_image_folder(), movie.filename)
+
+    def upcoming_movie(self):
+        """The movie the next round will show (the deck order is fixed when shuffled)."""
+        return self.deck.peek()
+
     def next_movie(self):
         """Pick a random movie that hasn't been shown yet."""
-        available = [m for m in self.valid_movies if m['filename'] not in self.shown_movies]
+        movie = self.deck.draw()
 
-        if available:
-            self.current_movie = random.choice(available)
-            self.shown_movies.append(self.current_movie['filename'])
+        if movie:
+            self.current_movie = movie
+            self.shown_positions[movie.filename] = len(self.shown_movies)
+            self.shown_movies.append(movie.filename)
             # Use configured timer duration for team mode, default for solo
-            self.time_left = self.timer_duration if self.team_mode else GAME_DURATION_SEC
+            self.round_duration = self.timer_duration if self.team_mode else GAME_DURATION_SEC
+            self.round_started_at = None
+            self.paused_total = 0.0
+            self.paused_at = None
             self.show_hint = False
             self.show_answer = False
             self.hint_used = False
@@ -1358,6 +2988,8 @@ class GameState:
     def reset_game(self):
         """Reset the game to start over."""
         self.shown_movies = []
+        self.shown_positions = {}
+        self.deck.reset()
         self.game_over = False
         self.score = 0
         self.current_screen = 'game'
@@ -1386,7 +3018,7 @@ class GameState:
 
         # Calculate time-based points (proportional to timer duration)
         duration = self.timer_duration if self.team_mode else GAME_DURATION_SEC
-        time_ratio = self.time_left / duration
+        time_ratio = self.remaining() / duration
 
         # Feature 2 & 3: Timer paused or image revealed locks to last-third rate (50 points)
         if self.timer_paused or self.image_revealed:
@@ -1424,12 +3056,47 @@ class GameState:
 
     def remaining_count(self):
         """Count of movies not yet shown."""
-        return len(self.valid_movies) - len(self.shown_movies)
+        return self.deck.remaining()
 
     def get_timer_duration(self):
         """Get the current timer duration based on game mode."""
         return self.timer_duration if self.team_mode else GAME_DURATION_SEC
 
+    def remaining(self):
+        """Seconds left in the round, from monotonic timestamps (paused time excluded)."""
+        if self.round_started_at is None:
+            return float(self.round_duration)
+        now = self.paused_at if self.paused_at is not None else time.monotonic()
+        elapsed = now - self.round_started_at - self.paused_total
+        return max(0.0, self.round_duration - elapsed)
+
+    @property
+    def time_left(self):
+        """Whole seconds left, as shown on the clock."""
+        return math.ceil(self.remaining())
+
+    def deadline(self):
+        """Monotonic time at which the running round times out (None if stopped)."""
+        if not self.timer_active or self.round_started_at is None:
+            return None
+        return self.round_started_at + self.paused_total + self.round_duration
+
+    def start_clock(self):
+        """Start (or resume) the round countdown."""
+        now = time.monotonic()
+        if self.round_started_at is None:
+            self.round_started_at = now
+        elif self.paused_at is not None:
+            self.paused_total += now - self.paused_at
+        self.paused_at = None
+        self.timer_active = True
+
+    def stop_clock(self):
+        """Stop the countdown, keeping the time that was left."""
+        if self.timer_active and self.paused_at is None and self.round_started_at is not None:
+            self.paused_at = time.monotonic()
+        self.timer_active = False
+
     def calculate_blur(self):
         """
         Calculate blur amount based on time remaining.
@@ -1437,6 +3104,10 @@ class GameState:
         Scales automatically with timer duration.
         Returns 0 if progressive reveal is disabled.
         """
+        return round(self._blur_ratio() * MAX_BLUR_PX, 1)
+
+    def _blur_ratio(self):
+        """Unrounded blur as a fraction of MAX_BLUR_PX (1.0 at round start, 0 once clear)."""
         if not self.progressive_reveal:
             return 0
         # Feature 2 & 3: Instant clear when timer paused or image revealed
@@ -1444,16 +3115,31 @@ class GameState:
             return 0
         total_time = self.get_timer_duration()
         # Clear blur completely in last 10 seconds
-        if self.time_left <= 10:
+        remaining = self.remaining()
+        if remaining <= 10:
             return 0
         # Calculate ratio: starts at 1.0 (full blur), decreases to 0
-        ratio = (self.time_left - 10) / (total_time - 10)
-        max_blur = 10  # Maximum blur in pixels (recognizable but challenging)
-        return round(ratio * max_blur, 1)
+        return (remaining - 10) / (total_time - 10)
+
+    def reveal_tier(self):
+        """Index into REVEAL_TIERS for the current blur (calculate_blur()), or None once the image is clear."""
+        ratio = self._blur_ratio()
+        if ratio <= 0:
+            return None
+        return min(len(REVEAL_TIERS) - 1, int((1 - ratio) * len(REVEAL_TIERS)))
+
+    def reveal_tier_deadline(self):
+        """Monotonic time the running round moves on from its current reveal tier (None if it won't)."""
+        tier = self.reveal_tier()
+        if tier is None or not self.timer_active:
+            return None
+        # Seconds left when the blur drops below this tier's share of the reveal
+        switch_at = 10 + (1 - (tier + 1) / len(REVEAL_TIERS)) * (self.get_timer_duration() - 10)
+        return self.deadline() - switch_at
 
     def total_count(self):
         """Total number of movies."""
-        return len(self.valid_movies)
+        return len(self.deck)
 
     def shown_count(self):
         """Number of movies shown."""
@@ -1463,52 +3149,45 @@ class GameState:
         """Generate hint text."""
         if not self.current_movie:
             return ""
-        custom_hint = self.current_movie.get('hint', '')
-        if pd.isna(custom_hint) or custom_hint == '' or custom_hint == '"No hint"':
-            movie_name = self.current_movie['movie_name']
-            return f"Starts with '{movie_name[0]}' • {len(movie_name)} characters"
-        return custom_hint.strip('"')
+        return self.current_movie.hint_text
 
     def get_hint_text_for_movie(self, movie):
         """Generate hint text for a specific movie (used in review mode)."""
         if not movie:
             return ""
-        custom_hint = movie.get('hint', '')
-        if pd.isna(custom_hint) or custom_hint == '' or custom_hint == '"No hint"':
-            movie_name = movie['movie_name']
-            return f"Starts with '{movie_name[0]}' • {len(movie_name)} characters"
-        return custom_hint.strip('"')
+        return movie.hint_text
 
     # Feature 1: History navigation (review mode)
     def is_reviewing(self):
         """Check if currently in review mode."""
         return self.reviewing_movie is not None
 
+    def get_review_index(self):
+        """Position of the reviewed movie in the shown sequence (or None)."""
+        if self.reviewing_movie is None:
+            return None
+        return self.shown_positions.get(self.reviewing_movie.filename)
+
     def enter_review(self, index):
         """Enter review mode to view a previously shown movie."""
         if index < 0 or index >= len(self.shown_movies) - 1:
             return  # Can't review current or future movies
         filename = self.shown_movies[index]
-        movie = next((m for m in self.valid_movies if m['filename'] == filename), None)
+        movie = self.find_movie(filename)
         if not movie:
             return
 
-        # Save current game state
-        self.saved_time_left = self.time_left
+        # Save current game state (the stopped clock keeps the time left)
         self.saved_timer_active = self.timer_active
         self.reviewing_movie = movie
         # Pause timer while reviewing
-        self.timer_active = False
+        self.stop_clock()
 
     def exit_review(self):
         """Exit review mode and return to current game."""
         if not self.reviewing_movie:
             return
         self.reviewing_movie = None
-        # Restore saved time but keep timer paused (user must click timer to resume)
-        if self.saved_time_left is not None:
-            self.time_left = self.saved_time_left
-            self.saved_time_left = None
         # Timer stays paused - user clicks timer to resume (consistent with Feature 2)
         self.saved_timer_active = False
 
@@ -1516,150 +3195,286 @@ class GameState:
 # =============================================================================
 # MAIN UI
 # =============================================================================
-def create_game_ui():
+def create_game_ui(resume=None):
     """Creates the main game interface with Bollywood theming."""
 
-    game = GameState()
+    parked = unpark_game(resume)
+    game = GameState.from_dict(parked) if parked else GameState()
 
     # UI element references
+    page_root = None
     main_container = None
     timer_display = None
     countdown_overlay = None
     image_container = None
     image_element = None  # Reference to image for blur updates
+    image_key = None      # (filename, reviewing, round) the image element was created for
+    preloaded_filename = None  # Upcoming movie whose image the browser was last told to fetch
+    hint_label = None
+    answer_label = None
+    progress_dots = []
     hint_container = None
     answer_container = None
     progress_container = None
     next_btn = None
+    timer_container_el = None
+    review_bar = None       # Game screen parts shown or hidden per round
+    review_controls = None
+    game_controls = None
     # Team mode UI elements
+    turn_badge = None
     scoreboard_container = None
     scoring_buttons_container = None
+    team_chips = []
+    team_score_labels = []
 
-    # ---------- TIMER UPDATE ----------
-    def update_timer():
-        """Called every second to update the countdown."""
-        if not game.timer_active:
-            return
+    # ---------- ROUND CLOCK ----------
+    # The browser animates the countdown (see startRoundClock in the head script);
+    # the server only handles transitions: start, pause, reveal and timeout.
 
-        game.time_left -= 1
+    def start_round_clock():
+        """Start the countdown on the server and in the browser."""
+        game.start_clock()
+        ui.run_javascript(f'startRoundClock({game.remaining():.3f})')
+        if image_element:
+            image_element.classes(remove='blur-paused')
+        schedule_time_up()
+        show_reveal_tier()
 
-        # Update timer display
-        minutes = game.time_left // 60
-        seconds = game.time_left % 60
-        timer_display.set_text(f"{minutes}:{seconds:02d}")
+    def schedule_time_up():
+        """(Re)arm this session's entry in the shared round scheduler."""
+        round_scheduler.schedule(game, game.deadline(), on_deadline)
 
-        # Update progressive blur on image
-        if image_element and not game.show_answer:
-            blur = game.calculate_blur()
-            image_element.style(
-                f'max-height: min(55vh, 450px); object-fit: contain; '
-                f'filter: blur({blur}px); transition: filter 0.3s ease-out;'
-            )
+    def on_deadline():
+        """Scheduler callback: re-enter this page's context and handle the timeout."""
+        if page_root.is_deleted:
+            return
+        with page_root:
+            on_time_up()
 
-        # Countdown overlay for last 10 seconds
-        if not countdown_overlay:
+    def stop_round_clock():
+        """Stop the countdown on the server and in the browser."""
+        game.stop_clock()
+        ui.run_javascript('stopRoundClock()')
+        if image_element:
+            image_element.classes(add='blur-paused')
+        round_scheduler.cancel(game)
+        round_scheduler.cancel((game, 'tier'))
+
+    def on_time_up():
+        """Called once at the round deadline."""
+        if not game.timer_active:
+            return
+        if game.remaining() > 0:
+            schedule_time_up()  # Woke early; wait out the rest
+            return
+        record_clock_lateness(time.monotonic() - game.deadline())
+        stop_round_clock()
+        # Auto-reveal answer when time's up
+        game.show_answer = True
+        refresh_game_content()
+        # Flash the timeout clock (the browser owns the overlay and hides it again)
+        ui.run_javascript('showTimeUp()')
+
+    # ---------- REVEAL TIERS ----------
+    # With Pillow installed the progressive reveal swaps between pre-blurred,
+    # low-resolution copies of the frame (REVEAL_TIERS) instead of running a
+    # CSS blur over the full image; the swaps ride on the round scheduler.
+
+    def frame_sources(movie, tier):
+        """(src, srcset) for a movie's image: reveal tier `tier`, or the full image when None."""
+        tier_src = frame_tier_url(movie, tier) if tier is not None else None
+        if tier_src:
+            return tier_src, ''
+        return game.get_image_source(movie), frame_srcset(movie)
+
+    def show_reveal_tier():
+        """Point the image at the reveal tier for the current blur and arm the swap to the next one."""
+        round_scheduler.cancel((game, 'tier'))
+        movie = game.reviewing_movie if game.is_reviewing() else game.current_movie
+        if image_element is None or movie is None:
+            return
+        tier = None if game.is_reviewing() or game.show_answer else game.reveal_tier()
+        src, srcset = frame_sources(movie, tier)
+        if image_element.source != src:
+            image_element.set_source(src)
+        if image_element.props.get('srcset', '') != srcset:
+            if srcset:
+                # Let the browser pick the variant for its screen width
+                image_element.props.update(srcset=srcset, sizes=IMAGE_SIZES)
+            else:
+                image_element.props.pop('srcset')
+                image_element.props.pop('sizes')
+        if tier is not None and frame_tier_url(movie, tier) is not None and game.timer_active:
+            # A tier is on screen: wake up when the next one is due
+            round_scheduler.schedule((game, 'tier'), game.reveal_tier_deadline(), on_reveal_tier_due)
+
+    def on_reveal_tier_due():
+        """Scheduler callback: move the image on to the next reveal tier."""
+        if page_root.is_deleted:
             return
+        with page_root:
+            show_reveal_tier()
+
+    # ---------- BACKGROUND TABS ----------
+    # A hidden tab pauses its round and drops the game screen; after IDLE_TIMEOUT_SEC
+    # the game is parked in _suspended_games and the browser disconnects.
+    ui_released = False
 
-        if game.time_left <= 10 and game.time_left > 0:
-            countdown_overlay.set_text(str(game.time_left))
-            countdown_overlay.style('display: block;')
-            ui.run_javascript(f'playTick({game.time_left})')
-        elif game.time_left <= 0:
-            game.timer_active = False
-            # Auto-reveal answer when time's up
-            game.show_answer = True
-            refresh_game_content()
-            # Show timeout clock AFTER refresh (which recreates countdown_overlay)
-            if countdown_overlay:
-                countdown_overlay.set_text("⏰")
-                countdown_overlay.style('display: block; font-size: 4rem;')
-                # Hide the clock after a brief moment
-                ui.timer(2.0, lambda: countdown_overlay.style('display: none;') if countdown_overlay else None, once=True)
+    def on_tab_visibility(e):
+        if e.args.get('hidden'):
+            on_tab_hidden()
         else:
-            countdown_overlay.style('display: none;')
+            on_tab_shown()
+
+    def on_tab_hidden():
+        SUSPEND_STATS['hidden'] += 1
+        if game.current_screen == 'game' and not game.game_over:
+            if game.timer_active:
+                stop_round_clock()  # Resumes when the rebuilt image loads
+            release_game_screen()
+        if IDLE_TIMEOUT_SEC > 0:
+            round_scheduler.schedule((game, 'idle'), time.monotonic() + IDLE_TIMEOUT_SEC, on_idle)
+
+    def on_tab_shown():
+        nonlocal ui_released
+        round_scheduler.cancel((game, 'idle'))
+        if ui_released:
+            ui_released = False
+            show_game_screen()
+
+    def release_game_screen():
+        """Drop the game screen's elements; show_game_screen() rebuilds them from the game state."""
+        nonlocal ui_released, timer_display, countdown_overlay, image_container, image_element, hint_label, answer_label
+        nonlocal hint_container, answer_container, progress_container, next_btn
+        nonlocal timer_container_el, review_bar, review_controls, game_controls
+        nonlocal turn_badge, scoreboard_container, scoring_buttons_container
+        main_container.clear()
+        timer_display = countdown_overlay = image_container = image_element = None
+        hint_container = answer_container = progress_container = next_btn = None
+        timer_container_el = review_bar = review_controls = game_controls = None
+        turn_badge = scoreboard_container = scoring_buttons_container = None
+        hint_label = answer_label = None
+        progress_dots.clear()
+        team_chips.clear()
+        team_score_labels.clear()
+        ui_released = True
+
+    def on_idle():
+        """Scheduler callback: park the game and let the browser disconnect."""
+        if page_root.is_deleted:
+            return
+        with page_root:
+            token = park_game(game.to_dict())
+            main_container.clear()
+            ui.run_javascript(f"detachSession('/?resume={token}')")
 
     # ---------- UI REFRESH ----------
     def refresh_game_content():
-        """Refresh the game content area."""
-
-        # Update progress dots
-        progress_container.clear()
-        with progress_container:
-            with ui.row().classes('progress-dots'):
-                for i in range(game.total_count()):
-                    dot_class = 'progress-dot'
-                    if i < game.shown_count() - 1:
-                        dot_class += ' completed clickable'
-                        # Check if this dot is the one being reviewed
-                        if game.is_reviewing() and game.shown_movies[i] == game.reviewing_movie['filename']:
-                            dot_class += ' reviewing'
-                    elif i == game.shown_count() - 1 and not game.is_reviewing():
-                        dot_class += ' current'
-                    dot = ui.element('div').classes(dot_class)
-                    # Make completed dots clickable
-                    if i < game.shown_count() - 1:
-                        dot.on('click', lambda e, idx=i: on_dot_click(idx))
+        """Bring the game screen up to date, changing only what differs."""
+        nonlocal countdown_overlay, image_element, image_key, hint_label, answer_label
+
+        # Update progress dots (created once per screen, then re-classed in place)
+        review_index = game.get_review_index()
+        if not progress_dots:
+            with progress_container:
+                with ui.row().classes('progress-dots'):
+                    for i in range(game.total_count()):
+                        # on_dot_click ignores the current and future dots
+                        progress_dots.append(ui.element('div').on('click', lambda e, idx=i: on_dot_click(idx)))
+        for i, dot in enumerate(progress_dots):
+            dot_class = 'progress-dot'
+            if i < game.shown_count() - 1:
+                dot_class += ' completed clickable'
+                # Check if this dot is the one being reviewed
+                if i == review_index:
+                    dot_class += ' reviewing'
+            elif i == game.shown_count() - 1 and not game.is_reviewing():
+                dot_class += ' current'
+            dot.classes(replace=dot_class)
 
         if game.game_over:
             show_game_over()
             return
 
+        timer_clickable = not game.is_reviewing() and not game.show_answer and not game.timer_paused
+        timer_container_el.classes(replace='timer-container' + (' timer-clickable' if timer_clickable else ''))
+
         # Determine which movie to display (review mode or current)
         display_movie = game.reviewing_movie if game.is_reviewing() else game.current_movie
 
         if display_movie:
-            # Update image and countdown overlay
-            nonlocal countdown_overlay, image_element
-            image_container.clear()
-            with image_container:
-                # Image with onload handler to start timer
-                img_path = os.path.join(game.get_image_folder(), display_movie['filename'])
-                # In review mode: no blur. Normal mode: blur based on answer state and time
-                if game.is_reviewing():
-                    blur = 0
-                else:
-                    blur = 0 if game.show_answer else game.calculate_blur()
-
-                # Determine if image should be clickable (Feature 3, one-way action)
-                image_clickable = not game.is_reviewing() and not game.show_answer and not game.image_revealed and blur > 0
-                image_classes = 'max-w-full rounded-lg game-image' + (' image-clickable' if image_clickable else '')
-
-                image_element = ui.image(img_path).classes(image_classes).style(
-                    f'max-height: min(55vh, 450px); object-fit: contain; '
-                    f'filter: blur({blur}px); transition: filter 0.3s ease-out;'
-                )
-                # Add click handler for image (Feature 3)
-                if image_clickable:
+            # In review mode: no blur. Normal mode: blur based on answer state and time
+            if game.is_reviewing():
+                blur = 0
+            else:
+                blur = 0 if game.show_answer else game.calculate_blur()
+
+            # Determine if image should be clickable (Feature 3, one-way action)
+            image_clickable = not game.is_reviewing() and not game.show_answer and not game.image_revealed and blur > 0
+            image_classes = 'max-w-full rounded-lg game-image' + (' image-clickable' if image_clickable else '')
+            # CSS blur only when there are no pre-blurred tiers to swap through
+            css_blur = blur > 0 and frame_tier_url(display_movie, 0) is None
+            if css_blur:
+                image_classes += ' progressive-blur' + ('' if game.timer_active else ' blur-paused')
+
+            # A different frame gets a fresh image element, so its blur animation starts over;
+            # the same frame only has its classes updated
+            key = (display_movie.filename, game.is_reviewing(), game.shown_count())
+            if image_element is None or image_key != key:
+                if image_element:
+                    image_element.delete()
+                image_style = 'max-height: min(55vh, 450px); object-fit: contain;'
+                if css_blur:
+                    # CSS animation picks up the blur schedule where the round currently is
+                    elapsed = game.round_duration - game.remaining()
+                    image_style += f' --blur-duration: {game.round_duration - 10}s; --blur-delay: -{elapsed:.2f}s;'
+                with image_container:
+                    image_element = ui.image().style(image_style)  # Source set by show_reveal_tier()
+                    if display_movie.width and display_movie.height:
+                        # Reserve the frame's space up front (QImg otherwise guesses 16:9 until it loads)
+                        image_element.props['ratio'] = round(display_movie.width / display_movie.height, 4)
+                    if display_movie.placeholder:
+                        image_element.props['placeholder-src'] = display_movie.placeholder
+                    # Feature 3 click (on_image_click ignores clicks once the blur is gone)
                     image_element.on('click', on_image_click)
-                # Start timer when image loads (only in normal mode)
-                image_element.on('load', lambda: start_timer_after_load())
-                # Re-create countdown overlay inside image container (only in normal mode)
-                if not game.is_reviewing():
-                    countdown_overlay = ui.label("").classes('countdown-overlay').style('display: none;')
+                    # Start timer when image loads (only in normal mode)
+                    image_element.on('load', lambda: start_timer_after_load())
+                    if not game.is_reviewing():
+                        # Fetch the next round's image once this one is in
+                        image_element.on('load', lambda: preload_next_frame())
+                    image_element.move(target_index=0)
+                    if countdown_overlay is None:
+                        countdown_overlay = ui.label("").classes('countdown-overlay').style('display: none;')
+                image_key = key
+            image_element.classes(replace=image_classes)
+            show_reveal_tier()
 
             # Update hint - more compact
-            hint_container.clear()
+            if hint_label is None:
+                with hint_container:
+                    with ui.element('div').classes('hint-box').style('padding: 6px 12px; margin-top: 4px;'):
+                        hint_label = ui.label().style('color: #1A0A14; font-size: clamp(0.8rem, 2.5vw, 1rem);')
             # In review mode, use local review state; in normal mode, use game state
             show_hint_now = review_show_hint['value'] if game.is_reviewing() else game.show_hint
             if show_hint_now:
                 hint_text = game.get_hint_text_for_movie(display_movie) if game.is_reviewing() else game.get_hint_text()
-                with hint_container:
-                    with ui.element('div').classes('hint-box').style('padding: 6px 12px; margin-top: 4px;'):
-                        ui.label(f"💡 {hint_text}").style(
-                            'color: #1A0A14; font-size: clamp(0.8rem, 2.5vw, 1rem);'
-                        )
+                hint_label.set_text(f"💡 {hint_text}")
+            hint_container.set_visibility(show_hint_now)
 
             # Update answer - more compact
-            answer_container.clear()
-            # In review mode, use local review state; in normal mode, use game state
-            show_answer_now = review_show_answer['value'] if game.is_reviewing() else game.show_answer
-            if show_answer_now:
+            if answer_label is None:
                 with answer_container:
                     with ui.element('div').classes('answer-box').style('padding: 6px 12px; margin-top: 4px;'):
-                        ui.label(f"🎬 {display_movie['movie_name']}").classes('movie-answer-text').style(
+                        answer_label = ui.label().classes('movie-answer-text').style(
                             'color: #1A0A14; font-size: clamp(0.9rem, 3.5vw, 1.5rem); font-weight: 700; '
                             'font-family: "Rozha One", serif;'
                         )
+            # In review mode, use local review state; in normal mode, use game state
+            show_answer_now = review_show_answer['value'] if game.is_reviewing() else game.show_answer
+            if show_answer_now:
+                answer_label.set_text(f"🎬 {display_movie.title}")
+            answer_container.set_visibility(show_answer_now)
 
             # Update next button (only in normal mode)
             if not game.is_reviewing() and next_btn:
@@ -1672,14 +3487,15 @@ def create_game_ui():
     # ---------- GAME OVER SCREEN ----------
     def show_game_over():
         """Display the game over celebration screen."""
-        game.timer_active = False
-        if countdown_overlay:
-            countdown_overlay.style('display: none;')
+        game.current_screen = 'gameover'
+        stop_round_clock()
         main_container.clear()
         category_plural = game.get_theme_config().get('category_label_plural', 'movies')
 
         with main_container:
-            ui.run_javascript('playVictory(); createConfetti();')
+            c = game.get_theme_colors()
+            confetti_colors = json.dumps([c['primary'], c['accent'], c['secondary'], c['primary_light']])
+            ui.run_javascript(f'playVictory(); createConfetti({confetti_colors});')
 
             with ui.column().classes('celebration-container w-full items-center gap-6 py-8'):
                 # Trophy
@@ -1772,7 +3588,23 @@ def create_game_ui():
         if game.timer_paused:
             return
         if not game.timer_active and not game.show_answer and not game.game_over:
-            game.timer_active = True
+            start_round_clock()
+
+    def preload_next_frame():
+        """Have the browser fetch and decode the next round's image in the background."""
+        nonlocal preloaded_filename
+        # The image loads again on each tier swap; compare filenames before any (SQLite) lookup
+        top = game.deck.peek_filename()
+        if top is None or top == preloaded_filename:
+            return
+        preloaded_filename = top
+        movie = game.upcoming_movie()
+        if movie is None or frame_url(movie) is None:
+            return
+        # The round opens on its most blurred tier, so that is all it needs up front
+        src, srcset = frame_sources(movie, 0 if game.progressive_reveal else None)
+        args = [src, srcset, IMAGE_SIZES]
+        ui.run_javascript(f"preloadImage({', '.join(json.dumps(arg) for arg in args)})")
 
     # ---------- FEATURE 1: History Navigation (Review Mode) ----------
     # Local state for review mode hint/answer display
@@ -1790,21 +3622,21 @@ def create_game_ui():
                 game.enter_review(index)
                 review_show_hint['value'] = False
                 review_show_answer['value'] = False
-                build_game_screen()  # Rebuild to show review mode
+                show_game_screen()
             return
         # Stop timer and enter review mode
-        game.timer_active = False
         game.enter_review(index)
+        stop_round_clock()
         review_show_hint['value'] = False
         review_show_answer['value'] = False
-        build_game_screen()  # Rebuild to show review mode
+        show_game_screen()
 
     def exit_review_mode():
         """Exit review mode and return to current game."""
         game.exit_review()
         review_show_hint['value'] = False
         review_show_answer['value'] = False
-        build_game_screen()  # Rebuild for normal game
+        show_game_screen()
 
     def show_review_hint():
         """Show hint in review mode."""
@@ -1830,16 +3662,16 @@ def create_game_ui():
 
         if game.timer_active:
             # Pause the timer (one-way action - user uses nav buttons when ready)
-            game.timer_active = False
+            stop_round_clock()
             game.timer_paused = True
             # Blur clears instantly (handled in calculate_blur)
             # Answer stays hidden (show_answer remains False)
-            if countdown_overlay:
-                countdown_overlay.style('display: none;')
             # Remove clickable cursor from timer using JavaScript
-            ui.run_javascript("document.querySelector('.timer-clickable')?.classList.remove('timer-clickable')")
-            # Refresh content to update image (removes clickable class since blur is now 0)
-            refresh_game_content()
+            timer_container_el.classes(remove='timer-clickable')
+            # Snap the blur clear (and the image is no longer clickable)
+            if image_element:
+                image_element.classes(add='blur-clear', remove='image-clickable')
+            show_reveal_tier()
 
     # ---------- FEATURE 3: Click Image to Clear Blur ----------
     def on_image_click():
@@ -1854,8 +3686,10 @@ def create_game_ui():
         game.image_revealed = True
         # Timer continues (we don't stop it)
         # Answer stays hidden (show_answer remains False)
-        # Refresh content to update image (removes clickable class and clears blur)
-        refresh_game_content()
+        # Snap the blur clear and drop the clickable cursor
+        if image_element:
+            image_element.classes(add='blur-clear', remove='image-clickable')
+        show_reveal_tier()
 
     # ---------- BUTTON HANDLERS ----------
     def show_hint_click():
@@ -1865,31 +3699,15 @@ def create_game_ui():
 
     def reveal_answer_click():
         game.show_answer = True
-        game.timer_active = False
+        stop_round_clock()
         # Clear blur instantly on reveal
         if image_element:
-            image_element.style(
-                'max-height: min(55vh, 450px); object-fit: contain; '
-                'filter: blur(0px); transition: filter 0.3s ease-out;'
-            )
+            image_element.classes(add='blur-clear')
         # In team mode, show scoring buttons
         if game.team_mode:
             game.awaiting_score = True
             if scoring_buttons_container:
-                scoring_buttons_container.clear()
-                with scoring_buttons_container:
-                    # Simple icon buttons for scoring - colored icons on light backgrounds
-                    ui.button("✓", on_click=lambda: score_answer(True)).style(
-                        'background: white; color: #2E7D32; border: 3px solid #4CAF50; '
-                        'border-radius: 50%; width: 40px; height: 40px; min-width: 40px; '
-                        'font-size: 1.4rem; font-weight: 900; padding: 0; box-shadow: 0 2px 8px rgba(0,0,0,0.15);'
-                    ).tooltip('Correct - award points')
-                    ui.button("✗", on_click=lambda: score_answer(False)).style(
-                        'background: white; color: #C62828; border: 3px solid #F44336; '
-                        'border-radius: 50%; width: 40px; height: 40px; min-width: 40px; '
-                        'font-size: 1.4rem; font-weight: 900; padding: 0; box-shadow: 0 2px 8px rgba(0,0,0,0.15);'
-                    ).tooltip('Wrong - no points')
-                scoring_buttons_container.style('display: flex;')
+                scoring_buttons_container.set_visibility(True)
         refresh_game_content()
 
     def score_answer(correct: bool):
@@ -1899,7 +3717,7 @@ def create_game_ui():
 
         # Hide scoring buttons
         if scoring_buttons_container:
-            scoring_buttons_container.style('display: none;')
+            scoring_buttons_container.set_visibility(False)
 
         # Show points awarded notification
         if correct and points > 0:
@@ -1915,11 +3733,10 @@ def create_game_ui():
         if game.team_mode:
             game.switch_team()
 
+        stop_round_clock()
         if game.remaining_count() > 0:
             game.next_movie()
-            if countdown_overlay:
-                countdown_overlay.style('display: none;')
-            build_game_screen()  # Rebuild to update turn indicator
+            show_game_screen()  # New image, turn indicator and scores
         else:
             show_game_over()
 
@@ -1936,35 +3753,20 @@ def create_game_ui():
         proceed_to_next()
 
     def start_new_game():
+        stop_round_clock()
         game.reset_game()
-        if countdown_overlay:
-            countdown_overlay.style('display: none;')
-        build_game_screen()
+        show_game_screen()
 
     def start_game_from_welcome():
         game.welcome_step = 1  # Reset for next time
         game.current_screen = 'game'
         game.next_movie()
-        build_game_screen()
-
-    def _get_theme_item_count(theme_key):
-        """Get the number of valid items for a theme without changing game state."""
-        config = THEMES[theme_key]
-        csv_path = os.path.join(SCRIPT_DIR, config['csv_file'])
-        image_folder = os.path.join(SCRIPT_DIR, config['image_folder'])
-        df = load_data(csv_path)
-        return len(get_valid_game_data(df, image_folder))
-
-    def _get_category_total_count(cat_key):
-        """Get the total item count across all subcategories in a category."""
-        cat = CATEGORIES[cat_key]
-        if cat['subcategories'] is None:
-            # YOLO: count all themes
-            return sum(_get_theme_item_count(tk) for tk in THEMES)
-        return sum(
-            _get_theme_item_count(sub['theme_key'])
-            for sub in cat['subcategories'].values()
-        )
+        show_game_screen()
+
+    # ---------- THEME ----------
+    def apply_theme():
+        """Switch the page to the current theme's palette (one class on <body>)."""
+        ui.query('body').classes(remove=ALL_THEME_CLASSES, add=theme_class(game.theme))
 
     # ---------- WELCOME SCREEN ----------
     def build_welcome_screen():
@@ -2011,13 +3813,13 @@ def create_game_ui():
             """Handle category card click."""
             game.select_category(cat_key)
             # Update theme CSS if theme changed
-            ui.query('body').style(generate_body_bg(game.get_theme_colors()))
+            apply_theme()
             build_welcome_screen()
 
         def on_subcategory_click(sub_key):
             """Handle subcategory card click."""
             game.select_subcategory(sub_key)
-            ui.query('body').style(generate_body_bg(game.get_theme_colors()))
+            apply_theme()
             build_welcome_screen()
 
         def go_back_to_categories():
@@ -2061,7 +3863,7 @@ def create_game_ui():
                     # Category cards
                     with ui.row().classes('items-center justify-center gap-3 sm:gap-4 mt-2 flex-wrap'):
                         for cat_key, cat in CATEGORIES.items():
-                            total = _get_category_total_count(cat_key)
+                            total = get_category_item_count(cat_key)
                             with ui.element('div').classes('category-card').style(
                                 f'border-color: {cat["color"]}44;'
                             ).on('click', lambda _, ck=cat_key: on_category_click(ck)):
@@ -2105,7 +3907,7 @@ def create_game_ui():
                     # Subcategory cards
                     with ui.row().classes('items-center justify-center gap-3 sm:gap-4 mt-2 flex-wrap'):
                         for sub_key, sub in cat['subcategories'].items():
-                            count = _get_theme_item_count(sub['theme_key'])
+                            count = get_theme_item_count(sub['theme_key'])
                             item_label = THEMES[sub['theme_key']].get('category_label_plural', 'items')
                             with ui.element('div').classes('subcategory-card').on(
                                 'click', lambda _, sk=sub_key: on_subcategory_click(sk)
@@ -2149,12 +3951,24 @@ def create_game_ui():
                             duration = game.timer_duration if game.team_mode else GAME_DURATION_SEC
                             timer_label.set_text(f"⏱️ {duration} seconds per round")
 
+                    def on_category_filter(e):
+                        # Drop the difficulty filter if the combination would be empty
+                        difficulty = game.difficulty_filter
+                        if difficulty is not None and not game.count_matching(e.value, difficulty):
+                            difficulty = None
+                        game.set_filters(e.value, difficulty)
+                        build_welcome_screen()
+
+                    def on_difficulty_filter(e):
+                        game.set_filters(game.category_filter, e.value)
+                        build_welcome_screen()
+
                     colors = game.get_theme_colors()
 
                     # Show selection badge
                     cat = CATEGORIES.get(game.selected_category, {})
                     if game.selected_category == 'yolo':
-                        badge_text = f"🎲 YOLO Mode — {len(game.valid_movies)} items"
+                        badge_text = f"🎲 YOLO Mode — {game.total_count()} items"
                     else:
                         sub_name = ""
                         if cat.get('subcategories') and game.selected_subcategory:
@@ -2165,13 +3979,33 @@ def create_game_ui():
                         ui.label(badge_text)
 
                     # Item count
-                    item_count = len(game.valid_movies)
+                    item_count = game.total_count()
                     item_label = game.get_theme_config().get('category_label_plural', 'items').capitalize()
                     ui.label(f"🎬 {item_count} {item_label} to Guess").style(
                         f'color: {colors["text_dark"]}; font-size: clamp(0.9rem, 3vw, 1.1rem); '
                         'font-weight: 600; margin-top: 6px; opacity: 0.9;'
                     )
 
+                    # ---------- DECK FILTERS ----------
+                    categories, difficulties = game.get_filter_options()
+                    if len(categories) > 1 or len(difficulties) > 1:
+                        category_options = {None: f"All ({game.count_matching(None, game.difficulty_filter)})"}
+                        for value in categories:
+                            count = game.count_matching(value, game.difficulty_filter)
+                            if count or value == game.category_filter:
+                                category_options[value] = f"{value} ({count})"
+                        difficulty_options = {None: f"Any ({game.count_matching(game.category_filter, None)})"}
+                        for value in difficulties:
+                            count = game.count_matching(game.category_filter, value)
+                            if count or value == game.difficulty_filter:
+                                difficulty_options[value] = f"{value} ({count})"
+
+                        with ui.row().classes('items-center justify-center gap-2 mt-1'):
+                            ui.select(category_options, value=game.category_filter, label='Category',
+                                      on_change=on_category_filter).props('dense outlined').style('min-width: 130px;')
+                            ui.select(difficulty_options, value=game.difficulty_filter, label='Difficulty',
+                                      on_change=on_difficulty_filter).props('dense outlined').style('min-width: 110px;')
+
                     # ---------- GAME OPTIONS ----------
                     with ui.column().classes('items-center gap-1 sm:gap-2 mt-2 sm:mt-4'):
                         # Team mode toggle
@@ -2325,11 +4159,19 @@ def create_game_ui():
 
     # ---------- GAME SCREEN ----------
     def build_game_screen():
-        """Build the main game screen."""
+        """Build the game screen once per game; rounds then go through update_game_screen()."""
         nonlocal timer_display, image_container, hint_container, answer_container, progress_container, next_btn
         nonlocal scoreboard_container, scoring_buttons_container, countdown_overlay
+        nonlocal image_element, hint_label, answer_label
+        nonlocal timer_container_el, review_bar, turn_badge, game_controls, review_controls
 
         main_container.clear()
+        # The fresh containers below get their contents from refresh_game_content()
+        countdown_overlay = image_element = hint_label = answer_label = None
+        progress_dots.clear()
+        team_chips.clear()
+        team_score_labels.clear()
+        turn_badge = scoreboard_container = scoring_buttons_container = None
 
         with main_container:
             # Film strip top border
@@ -2350,12 +4192,10 @@ def create_game_ui():
 
                     # Right side: Timer + Help icon
                     with ui.row().classes('items-center gap-2').style('flex-shrink: 0;'):
-                        # Timer - compact circular design (clickable to pause, one-way action)
-                        timer_clickable = not game.is_reviewing() and not game.show_answer and not game.game_over and not game.timer_paused
-                        timer_classes = 'timer-container' + (' timer-clickable' if timer_clickable else '')
-                        timer_container_el = ui.element('div').classes(timer_classes).style('width: 50px; height: 50px;')
-                        if timer_clickable:
-                            timer_container_el.on('click', on_timer_click)
+                        # Timer - compact circular design (clickable to pause, one-way action;
+                        # on_timer_click ignores clicks when pausing doesn't apply)
+                        timer_container_el = ui.element('div').classes('timer-container').style('width: 50px; height: 50px;')
+                        timer_container_el.on('click', on_timer_click)
                         with timer_container_el:
                             with ui.element('div').classes('timer-inner').style('width: 100%; height: 100%;'):
                                 timer_display = ui.label(f"{game.time_left // 60}:{game.time_left % 60:02d}").classes('timer-text').style('font-size: 1.1rem;')
@@ -2365,23 +4205,14 @@ def create_game_ui():
                             ui.label('?').style('margin: 0; padding: 0; line-height: 1;')
 
                 # ---------- REVIEW MODE INDICATOR (Feature 1) ----------
-                if game.is_reviewing():
-                    with ui.row().classes('w-full justify-center items-center gap-3'):
-                        ui.label("📖 Reviewing Previous").classes('review-badge')
-                        ui.button("← Back to Game", on_click=exit_review_mode).classes('back-btn')
+                with ui.row().classes('w-full justify-center items-center gap-3') as review_bar:
+                    ui.label("📖 Reviewing Previous").classes('review-badge')
+                    ui.button("← Back to Game", on_click=exit_review_mode).classes('back-btn')
 
                 # ---------- TEAM TURN INDICATOR (Team mode only, not in review mode) - styled badge ----------
-                elif game.team_mode:
-                    team_color = "#E91E63" if game.current_team == 0 else "#2196F3"
-                    team_gradient = "linear-gradient(135deg, #E91E63, #C2185B)" if game.current_team == 0 else "linear-gradient(135deg, #2196F3, #1565C0)"
-                    team_emoji = "🔴" if game.current_team == 0 else "🔵"
+                if game.team_mode:
                     with ui.row().classes('w-full justify-center'):
-                        ui.label(f"✨ {game.get_current_team_name()}'s Turn ✨").style(
-                            f'color: white; font-size: clamp(0.8rem, 3vw, 1rem); font-weight: 700; '
-                            f'padding: 6px 16px; background: {team_gradient}; border-radius: 25px; '
-                            f'box-shadow: 0 3px 10px rgba(0,0,0,0.3), inset 0 1px 0 rgba(255,255,255,0.2); '
-                            f'border: 1px solid rgba(255,255,255,0.3); text-shadow: 0 1px 2px rgba(0,0,0,0.3);'
-                        )
+                        turn_badge = ui.label()
 
                 # ---------- IMAGE AREA (with relative positioning for countdown overlay) ----------
                 image_container = ui.element('div').classes(
@@ -2389,20 +4220,29 @@ def create_game_ui():
                 ).style('min-height: 150px; position: relative;')
 
                 # ---------- CONTROL BUTTONS (different in review mode) ----------
-                if game.is_reviewing():
-                    with ui.row().classes('w-full justify-center gap-1 md:gap-3 flex-wrap'):
-                        ui.button("💡 HINT", on_click=show_review_hint).classes('bollywood-btn btn-gold')
-                        ui.button("🎬 REVEAL", on_click=show_review_answer).classes('bollywood-btn btn-magenta')
-                else:
-                    with ui.row().classes('w-full justify-center gap-1 md:gap-3 flex-wrap'):
-                        ui.button("💡 HINT", on_click=show_hint_click).classes('bollywood-btn btn-gold')
-                        ui.button("🎬 REVEAL", on_click=reveal_answer_click).classes('bollywood-btn btn-magenta')
-                        next_btn = ui.button("▶ NEXT", on_click=next_movie_click).classes('bollywood-btn btn-turquoise')
+                with ui.row().classes('w-full justify-center gap-1 md:gap-3 flex-wrap') as review_controls:
+                    ui.button("💡 HINT", on_click=show_review_hint).classes('bollywood-btn btn-gold')
+                    ui.button("🎬 REVEAL", on_click=show_review_answer).classes('bollywood-btn btn-magenta')
+                with ui.row().classes('w-full justify-center gap-1 md:gap-3 flex-wrap') as game_controls:
+                    ui.button("💡 HINT", on_click=show_hint_click).classes('bollywood-btn btn-gold')
+                    ui.button("🎬 REVEAL", on_click=reveal_answer_click).classes('bollywood-btn btn-magenta')
+                    next_btn = ui.button("▶ NEXT", on_click=next_movie_click).classes('bollywood-btn btn-turquoise')
 
                 # ---------- SCORING BUTTONS (Team mode, shown after reveal, not in review mode) ----------
-                if game.team_mode and not game.is_reviewing():
+                if game.team_mode:
                     scoring_buttons_container = ui.row().classes('w-full justify-center items-center gap-3')
-                    scoring_buttons_container.style('display: none;')  # Hidden initially
+                    with scoring_buttons_container:
+                        # Simple icon buttons for scoring - colored icons on light backgrounds
+                        ui.button("✓", on_click=lambda: score_answer(True)).style(
+                            'background: white; color: #2E7D32; border: 3px solid #4CAF50; '
+                            'border-radius: 50%; width: 40px; height: 40px; min-width: 40px; '
+                            'font-size: 1.4rem; font-weight: 900; padding: 0; box-shadow: 0 2px 8px rgba(0,0,0,0.15);'
+                        ).tooltip('Correct - award points')
+                        ui.button("✗", on_click=lambda: score_answer(False)).style(
+                            'background: white; color: #C62828; border: 3px solid #F44336; '
+                            'border-radius: 50%; width: 40px; height: 40px; min-width: 40px; '
+                            'font-size: 1.4rem; font-weight: 900; padding: 0; box-shadow: 0 2px 8px rgba(0,0,0,0.15);'
+                        ).tooltip('Wrong - no points')
 
                 # ---------- HINT/ANSWER AREAS ----------
                 hint_container = ui.element('div').classes('w-full')
@@ -2415,71 +4255,204 @@ def create_game_ui():
                         # Compact single-line scoreboard
                         with ui.row().classes('w-full justify-center items-center gap-2').style('flex-wrap: nowrap;'):
                             # Team A score - compact inline
-                            team_a_active = game.current_team == 0
-                            with ui.row().classes('items-center gap-1').style(
-                                f'background: {"rgba(233,30,99,0.2)" if team_a_active else "rgba(0,0,0,0.05)"}; '
-                                f'padding: 4px 8px; border-radius: 6px; '
-                                f'border: 2px solid {"#E91E63" if team_a_active else "transparent"};'
-                            ):
+                            with ui.row().classes('items-center gap-1') as chip:
                                 ui.label(f"🔴 {game.team_names[0]}").style(
                                     'color: #E91E63; font-weight: 700; font-size: clamp(0.7rem, 2.5vw, 0.85rem); white-space: nowrap;'
                                 )
-                                ui.label(f"{game.team_scores[0]}").style(
+                                team_score_labels.append(ui.label().style(
                                     'color: #1A0A14; font-size: clamp(0.9rem, 3vw, 1.1rem); font-weight: 700;'
-                                )
+                                ))
+                            team_chips.append(chip)
 
                             # VS divider
                             ui.label("vs").style('color: #888; font-weight: 700; font-size: 0.8rem;')
 
                             # Team B score - compact inline
-                            team_b_active = game.current_team == 1
-                            with ui.row().classes('items-center gap-1').style(
-                                f'background: {"rgba(33,150,243,0.2)" if team_b_active else "rgba(0,0,0,0.05)"}; '
-                                f'padding: 4px 8px; border-radius: 6px; '
-                                f'border: 2px solid {"#2196F3" if team_b_active else "transparent"};'
-                            ):
+                            with ui.row().classes('items-center gap-1') as chip:
                                 ui.label(f"🔵 {game.team_names[1]}").style(
                                     'color: #2196F3; font-weight: 700; font-size: clamp(0.7rem, 2.5vw, 0.85rem); white-space: nowrap;'
                                 )
-                                ui.label(f"{game.team_scores[1]}").style(
+                                team_score_labels.append(ui.label().style(
                                     'color: #1A0A14; font-size: clamp(0.9rem, 3vw, 1.1rem); font-weight: 700;'
-                                )
+                                ))
+                            team_chips.append(chip)
 
             # Film strip bottom border
             ui.element('div').classes('film-strip-border w-full').style('border-radius: 0 0 12px 12px;')
 
         # Initialize content
+        update_game_screen()
+
+    def update_game_screen():
+        """Apply the current round (turn, scores, review mode) to the built game screen."""
+        reviewing = game.is_reviewing()
+
+        # The browser owns the timer text once its clock has run
+        ui.run_javascript(f'showRoundClock({game.remaining():.3f})')
+
+        review_bar.set_visibility(reviewing)
+        review_controls.set_visibility(reviewing)
+        game_controls.set_visibility(not reviewing)
+
+        if game.team_mode:
+            turn_badge.set_visibility(not reviewing)
+            team_gradient = "linear-gradient(135deg, #E91E63, #C2185B)" if game.current_team == 0 else "linear-gradient(135deg, #2196F3, #1565C0)"
+            turn_badge.set_text(f"✨ {game.get_current_team_name()}'s Turn ✨")
+            turn_badge.style(replace=
+                f'color: white; font-size: clamp(0.8rem, 3vw, 1rem); font-weight: 700; '
+                f'padding: 6px 16px; background: {team_gradient}; border-radius: 25px; '
+                f'box-shadow: 0 3px 10px rgba(0,0,0,0.3), inset 0 1px 0 rgba(255,255,255,0.2); '
+                f'border: 1px solid rgba(255,255,255,0.3); text-shadow: 0 1px 2px rgba(0,0,0,0.3);'
+            )
+            scoring_buttons_container.set_visibility(game.awaiting_score and not reviewing)
+            for i, (chip, score_label) in enumerate(zip(team_chips, team_score_labels)):
+                active = game.current_team == i
+                active_bg = "rgba(233,30,99,0.2)" if i == 0 else "rgba(33,150,243,0.2)"
+                active_border = "#E91E63" if i == 0 else "#2196F3"
+                chip.style(replace=
+                    f'background: {active_bg if active else "rgba(0,0,0,0.05)"}; '
+                    f'padding: 4px 8px; border-radius: 6px; '
+                    f'border: 2px solid {active_border if active else "transparent"};'
+                )
+                score_label.set_text(f"{game.team_scores[i]}")
+
         refresh_game_content()
 
+    def show_game_screen():
+        """Show the current round: build the game screen if it isn't up, else update it in place."""
+        client = main_container.client
+        first_id = client.next_element_id
+        with page_root:  # The clicked element may be gone (e.g. a welcome screen button)
+            if timer_display is None or timer_display.is_deleted:
+                build_game_screen()
+                record_render('screen_builds', client.next_element_id - first_id)
+            else:
+                update_game_screen()
+                record_render('round_updates', client.next_element_id - first_id)
+
     # ==========================================================================
     # BUILD THE PAGE
     # ==========================================================================
 
-    # Add head HTML (styles, fonts, scripts) with theme colors
-    ui.add_head_html(generate_theme_css(game.get_theme_colors()))
+    # Add head HTML (fonts, hashed stylesheet and game script)
+    ui.add_head_html(generate_head_html())
 
-    # Set body background with theme colors
-    ui.query('body').style(generate_body_bg(game.get_theme_colors()))
+    # Theme palette (CSS variables) and body background
+    apply_theme()
 
     # Main layout container
-    with ui.column().classes('w-full max-w-4xl mx-auto p-1 sm:p-4 md:p-8'):
+    with ui.column().classes('w-full max-w-4xl mx-auto p-1 sm:p-4 md:p-8') as page_root:
         # Game card container
         main_container = ui.element('div').classes('game-card w-full')
 
-    # Start with welcome screen
-    build_welcome_screen()
+    # Background tabs report in; closed tabs must not leave a deadline behind
+    ui.on('tab_visibility', on_tab_visibility)
+    ui.context.client.on_delete(lambda: [round_scheduler.cancel(key) for key in (game, (game, 'tier'), (game, 'idle'))])
 
-    # Start timer
-    ui.timer(1.0, update_timer)
+    # Start with welcome screen (or where a parked game left off)
+    if game.current_screen == 'game':
+        show_game_screen()
+    elif game.current_screen == 'gameover':
+        show_game_over()
+    else:
+        build_welcome_screen()
 
 
 # =============================================================================
 # APP ENTRY POINT
 # =============================================================================
 @ui.page('/')
-def main_page():
-    """Main page route."""
-    create_game_ui()
+def main_page(resume: str = None):
+    """Main page route (`?resume=<token>` picks up a game parked by an idle tab)."""
+    create_game_ui(resume)
+
+
+app.on_startup(build_static_assets)
+app.on_startup(warm_catalogs)
+app.on_startup(warm_frame_cache)
+app.on_startup(open_variant_cache)
+if CATALOG_WATCH:
+    app.on_startup(watch_catalogs)
+app.on_startup(round_scheduler.run)
+
+
+@app.get(ASSET_ROUTE + '/{name}')
+def asset_endpoint(name: str, request: Request):
+    """Hashed theme stylesheets and the game script, precompressed and cached for good."""
+    asset = _static_assets.get(name)
+    if asset is None:
+        return Response(status_code=404)
+    encoding = asset.negotiate(request.headers.get('accept-encoding', ''))
+    headers = {'Cache-Control': ASSET_CACHE_CONTROL, 'ETag': asset.etag(encoding), 'Vary': 'Accept-Encoding'}
+    if asset.etag(encoding) in request.headers.get('if-none-match', ''):
+        return Response(status_code=304, headers=headers)
+    if encoding != 'identity':
+        headers['Content-Encoding'] = encoding
+    return Response(asset.variants[encoding], media_type=asset.media_type, headers=headers)
+
+
+@app.get(FRAME_ROUTE + '/{name}')
+async def frame_endpoint(name: str, request: Request, w: int = 0, tier: int = None):
+    """Catalog images by content hash: cached for good, streamed straight from disk.
+
+    With `?w=<width>` (and Pillow installed) a width-bucketed variant in the
+    best format the `Accept` header allows is served instead; `?tier=<n>`
+    serves pre-blurred reveal tier n.
+    """
+    if tier is not None and not 0 <= tier < len(REVEAL_TIERS):
+        return Response(status_code=404)
+    content_hash = name.split('.', 1)[0]
+    key, spec = content_hash, None
+    headers = {'Cache-Control': ASSET_CACHE_CONTROL}
+    if (w > 0 or tier is not None) and variants_enabled():
+        spec = variant_spec(content_hash, request.headers.get('accept', ''), w, tier)
+        key = spec[0]
+        headers['Vary'] = 'Accept'
+    headers['ETag'] = etag = f'"{key}"'
+
+    # Hot frames come straight from memory, without resolving or touching the file
+    cached = frame_cache.get(key) if frame_cache is not None else None
+    if cached is not None:
+        if etag in request.headers.get('if-none-match', ''):
+            return Response(status_code=304, headers=headers)
+        return Response(cached[0], media_type=cached[1], headers=headers)
+
+    path = resolve_frame(content_hash)
+    if path is None or not os.path.isfile(path):
+        return Response(status_code=404)
+    if file_digest(path) != content_hash:
+        # Edited in place since the catalog was built: serve it, but don't let anyone keep it
+        return FileResponse(path, headers={'Cache-Control': 'no-cache'})
+    if etag in request.headers.get('if-none-match', ''):
+        return Response(status_code=304, headers=headers)  # Variant names are content-addressed too
+    if spec is not None:
+        data, media_type = await get_variant(path, spec), spec[1]
+        if data is None:
+            # Pillow can't render this file: fall back to the original so the round still loads
+            return FileResponse(path, headers={'Cache-Control': 'no-cache'})
+    else:
+        if frame_cache is None or not frame_cache.accepts(os.path.getsize(path)):
+            return FileResponse(path, headers=headers)  # Streamed, not cached
+        data, media_type = await run.io_bound(read_frame, path)
+    if frame_cache is not None:
+        frame_cache.put(key, data, media_type)
+    return Response(data, media_type=media_type, headers=headers)
+
+
+@app.get('/stats')
+def stats_endpoint():
+    """Lightweight counters for checking cache behaviour in production."""
+    return {
+        'backend': CATALOG_BACKEND,
+        'catalog': get_catalog_stats(),
+        'reload': RELOAD_STATS,
+        'clock': CLOCK_STATS,
+        'scheduler': {'pending': round_scheduler.pending(), 'fired': round_scheduler.fired},
+        'suspend': dict(SUSPEND_STATS, parked=len(_suspended_games)),
+        'render': RENDER_STATS,
+        'frame_cache': FRAME_CACHE_STATS,
+        'variants': dict(VARIANT_STATS, enabled=variants_enabled()),
+    }
 
 
 if __name__ in {"__main__", "__mp_main__"}: